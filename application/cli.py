@@ -0,0 +1,315 @@
+"""
+Interfaz de línea de comandos sin dependencias gráficas
+
+Nunca importa tkinter ni matplotlib, de modo que funciona en nodos sin pantalla.
+
+Uso:
+    python -m application.cli run --seed 7 --generations 300 --output run.json
+    python -m application.cli run --seed 7 --checkpoint run.npz --checkpoint-every 50
+    python -m application.cli run --resume run.npz --output run.json
+    python -m application.cli batch --runs 30 --workers 8 --output batch.json
+    python -m application.cli sweep --grid population_size=10,20,40 \
+        --grid pc_threshold=0.5:0.9:0.1 --runs 5 --format csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import signal
+import sys
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+# IMPORTACIONES ABSOLUTAS
+from config.exercises import ExerciseManager
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.run_history import RECORDING_LEVELS
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+from application.use_cases.run_seed_batch import RunSeedBatch
+from application.use_cases.run_parameter_sweep import (
+    RunParameterSweep, INTEGER_PARAMETERS, RESULT_COLUMNS, parameter_range
+)
+from application.use_cases.termination_criteria import (
+    StagnationCriterion, MinDiversityCriterion, TargetValueCriterion, MaxEvaluationsCriterion,
+    TimeBudgetCriterion, CancellationToken
+)
+
+
+# Argumento de la CLI -> campo de GAParameters
+PARAMETER_ARGUMENTS = {
+    'population': 'population_size',
+    'generations': 'num_generations',
+    'crossover': 'crossover_probability',
+    'mutation_x': 'mutation_x_probability',
+    'mutation_g': 'mutation_g_probability',
+}
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser):
+    """Ejercicio, parámetros del AG, motor y salida"""
+    parser.add_argument('--exercise', default=None, choices=list(ExerciseManager.AVAILABLE_EXERCISES),
+                        help="clave del ejercicio (por defecto el actual)")
+    parser.add_argument('--population', type=int, help="tamaño de la población")
+    parser.add_argument('--generations', type=int, help="número de generaciones")
+    parser.add_argument('--crossover', type=float, help="probabilidad de cruza")
+    parser.add_argument('--mutation-x', type=float, help="probabilidad de mutación del individuo")
+    parser.add_argument('--mutation-g', type=float, help="probabilidad de mutación del gen")
+    parser.add_argument('--engine', default='individual', choices=['individual', 'matrix'],
+                        help="motor de generaciones")
+    parser.add_argument('--cache-size', type=int, default=None,
+                        help="tamaño de la caché de fitness")
+    parser.add_argument('--stagnation', type=int, default=None,
+                        help="detener tras N generaciones sin mejora")
+    parser.add_argument('--target', type=float, default=None,
+                        help="detener al alcanzar este valor de la función")
+    parser.add_argument('--max-evaluations', type=int, default=None,
+                        help="detener al alcanzar N evaluaciones")
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help="detener tras S segundos")
+    parser.add_argument('--min-diversity', type=float, default=None,
+                        help="detener si la diversidad cae bajo este valor")
+    parser.add_argument('--diversity-metric', default=MinDiversityCriterion.DEFAULT_METRIC,
+                        choices=list(MinDiversityCriterion.METRICS),
+                        help="diversidad de --min-diversity (phenotype: desviación de x; "
+                             "hamming: bits de distancia media)")
+    parser.add_argument('--format', default='json', choices=['json', 'csv'],
+                        help="formato de salida")
+    parser.add_argument('--output', '-o', default=None,
+                        help="archivo de salida (por defecto la salida estándar)")
+
+
+def build_parameters(defaults: GAParameters, args: argparse.Namespace) -> GAParameters:
+    """Parámetros por defecto del ejercicio con los valores indicados en la CLI"""
+    overrides = {
+        field: getattr(args, argument)
+        for argument, field in PARAMETER_ARGUMENTS.items()
+        if getattr(args, argument) is not None
+    }
+    return replace(defaults, **overrides)
+
+
+def build_termination(use_case: RunExerciseGeneticAlgorithm, args: argparse.Namespace) -> list:
+    """Criterios de parada indicados en la CLI"""
+    criteria = []
+    if args.stagnation is not None:
+        criteria.append(StagnationCriterion(args.stagnation))
+    if args.target is not None:
+        criteria.append(TargetValueCriterion(args.target, use_case.exercise_config.objective_type))
+    if args.max_evaluations is not None:
+        criteria.append(MaxEvaluationsCriterion(args.max_evaluations))
+    if args.time_budget is not None:
+        criteria.append(TimeBudgetCriterion(args.time_budget))
+    if args.min_diversity is not None:
+        criteria.append(MinDiversityCriterion(args.min_diversity, args.diversity_metric))
+    return criteria
+
+
+def format_csv(rows: List[dict]) -> str:
+    """Filas como texto CSV con encabezado"""
+    stream = io.StringIO()
+    if rows:
+        writer = csv.DictWriter(stream, fieldnames=list(rows[0]), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    return stream.getvalue()
+
+
+@contextmanager
+def open_output(path: Optional[str]):
+    """Archivo indicado o salida estándar"""
+    if path:
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            yield file
+    else:
+        yield sys.stdout
+
+
+def write_output(text: str, path: Optional[str]):
+    """Escribe en el archivo indicado o en la salida estándar"""
+    with open_output(path) as stream:
+        stream.write(text)
+
+
+def parse_grid_argument(text: str) -> Tuple[str, list]:
+    """'nombre=v1,v2,...' o 'nombre=inicio:fin:paso' -> (nombre, valores)"""
+    name, separator, values = text.partition('=')
+    if not separator or not values:
+        raise argparse.ArgumentTypeError(
+            f"Formato inválido: {text} (use nombre=v1,v2 o nombre=inicio:fin:paso)"
+        )
+    convert = int if name in INTEGER_PARAMETERS else float
+    try:
+        if ':' in values:
+            start, stop, step = (float(value) for value in values.split(':'))
+            return name, [convert(value) for value in parameter_range(start, stop, step)]
+        return name, [convert(value) for value in values.split(',')]
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Valores inválidos en {text}: {error}")
+
+
+def _report_progress(done: int, total: int):
+    """Progreso por la salida de error para no mezclarlo con los resultados"""
+    print(f"{done}/{total}", file=sys.stderr, flush=True)
+
+
+def run_single(args: argparse.Namespace):
+    """
+    Subcomando run: una ejecución; CSV con una fila por generación.
+
+    Con --checkpoint, Ctrl+C detiene la ejecución guardando el checkpoint,
+    que luego se continúa con --resume.
+    """
+    use_case = RunExerciseGeneticAlgorithm(args.exercise)
+    cancellation = CancellationToken()
+    previous_handler = signal.signal(signal.SIGINT, lambda *_: cancellation.cancel())
+    try:
+        if args.resume:
+            result = use_case.resume(
+                args.resume,
+                termination=build_termination(use_case, args),
+                timing=args.timing,
+                cancellation=cancellation,
+                checkpoint_path=args.checkpoint,
+                checkpoint_every=args.checkpoint_every
+            )
+        else:
+            parameters = build_parameters(use_case._create_default_parameters(), args)
+            result = use_case.execute(
+                parameters,
+                engine=args.engine,
+                cache_size=args.cache_size,
+                recording=args.recording,
+                termination=build_termination(use_case, args),
+                seed=args.seed,
+                timing=args.timing,
+                cancellation=cancellation,
+                checkpoint_path=args.checkpoint,
+                checkpoint_every=args.checkpoint_every
+            )
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+    data = result.to_dict()
+
+    if args.format == 'csv':
+        curves = data['curves']
+        rows = [
+            {'generation': generation, **{name: values[generation] for name, values in curves.items()}}
+            for generation in range(len(curves.get('best_fitness', [])))
+        ]
+        text = format_csv(rows)
+    else:
+        text = json.dumps(data, indent=2) + '\n'
+    write_output(text, args.output)
+
+
+def run_batch(args: argparse.Namespace):
+    """Subcomando batch: K semillas en paralelo con estadísticas agregadas"""
+    batch = RunSeedBatch(args.exercise, max_workers=args.workers)
+    parameters = build_parameters(batch.use_case._create_default_parameters(), args)
+    result = batch.execute(
+        parameters,
+        num_runs=args.runs,
+        base_seed=args.seed,
+        progress_callback=None if args.quiet else _report_progress,
+        engine=args.engine,
+        cache_size=args.cache_size,
+        termination=build_termination(batch.use_case, args)
+    )
+
+    if args.format == 'csv':
+        text = format_csv(result.to_dict()['runs'])
+    else:
+        text = json.dumps(result.to_dict(), indent=2) + '\n'
+    write_output(text, args.output)
+
+
+def run_sweep(args: argparse.Namespace):
+    """Subcomando sweep: malla de parámetros con filas escritas al terminar cada una"""
+    grid = dict(args.grid)
+    sweep = RunParameterSweep(args.exercise, max_workers=args.workers)
+    parameters = build_parameters(sweep.use_case._create_default_parameters(), args)
+    rows = sweep.iterate(
+        grid,
+        parameters,
+        runs_per_combination=args.runs,
+        base_seed=args.seed,
+        engine=args.engine,
+        cache_size=args.cache_size,
+        termination=build_termination(sweep.use_case, args)
+    )
+
+    # JSON: una fila por línea (JSON Lines) para poder leerla mientras avanza
+    with open_output(args.output) as stream:
+        if args.format == 'csv':
+            writer = csv.DictWriter(
+                stream, fieldnames=['index', *grid, *RESULT_COLUMNS], lineterminator='\n'
+            )
+            writer.writeheader()
+        for row in rows:
+            if args.format == 'csv':
+                writer.writerow(row)
+            else:
+                stream.write(json.dumps(row) + '\n')
+            stream.flush()
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Parser con un subcomando por caso de uso"""
+    parser = argparse.ArgumentParser(
+        prog='python -m application.cli',
+        description="Algoritmo genético configurable sin interfaz gráfica"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="una ejecución del algoritmo")
+    _add_common_arguments(run)
+    run.add_argument('--seed', type=int, default=None, help="semilla de la ejecución")
+    run.add_argument('--recording', default='summary',
+                     choices=[level for level in RECORDING_LEVELS if level not in ('every_k', 'full')],
+                     help="estadísticas por generación a incluir")
+    run.add_argument('--timing', action='store_true', help="medir el tiempo de cada fase")
+    run.add_argument('--checkpoint', default=None,
+                     help="archivo .npz donde guardar checkpoints (también al cancelar con Ctrl+C)")
+    run.add_argument('--checkpoint-every', type=int, default=0,
+                     help="guardar el checkpoint cada N generaciones (0: solo al terminar)")
+    run.add_argument('--resume', default=None,
+                     help="continuar desde un checkpoint; los parámetros del archivo tienen prioridad")
+    run.set_defaults(handler=run_single)
+
+    batch = subparsers.add_parser('batch', help="repetir una configuración con varias semillas")
+    _add_common_arguments(batch)
+    batch.add_argument('--runs', type=int, default=30, help="número de corridas")
+    batch.add_argument('--seed', type=int, default=0, help="semilla maestra de las corridas")
+    batch.add_argument('--workers', type=int, default=None,
+                       help="procesos trabajadores (0 ejecuta en el proceso actual)")
+    batch.add_argument('--quiet', '-q', action='store_true', help="no mostrar el progreso")
+    batch.set_defaults(handler=run_batch)
+
+    sweep = subparsers.add_parser('sweep', help="barrer una malla de parámetros")
+    _add_common_arguments(sweep)
+    sweep.add_argument('--grid', type=parse_grid_argument, action='append', required=True,
+                       help="nombre=v1,v2,... o nombre=inicio:fin:paso (repetible)")
+    sweep.add_argument('--runs', type=int, default=1, help="corridas por combinación")
+    sweep.add_argument('--seed', type=int, default=0, help="semilla maestra de las corridas")
+    sweep.add_argument('--workers', type=int, default=None,
+                       help="procesos trabajadores (0 ejecuta en el proceso actual)")
+    sweep.set_defaults(handler=run_sweep)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de la CLI"""
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.handler(args)
+    except ValueError as error:
+        parser.error(str(error))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Checkpoints de una ejecución en formato binario comprimido (.npz)
+
+Un checkpoint guarda la población, el estado del generador aleatorio, la
+generación, los contadores, la caché de fitness y el historial, de modo que
+RunExerciseGeneticAlgorithm.resume() continúa la ejecución bit a bit.
+"""
+
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.run_history import RunHistory
+
+
+# Versión del formato del archivo
+CHECKPOINT_VERSION = 3
+
+# Prefijo de los arreglos del historial dentro del archivo
+_HISTORY_PREFIX = 'history_'
+
+
+@dataclass
+class Checkpoint:
+    """
+    Estado de una ejecución al terminar la generación `generation`.
+
+    rng_state es el estado de get_rng_state (con el nombre del generador de
+    bits); stop_reason es None en los checkpoints periódicos y el motivo de
+    parada en el final; cache_* es el contenido y los contadores de la caché LRU.
+    """
+
+    exercise_title: str
+    strategy_params: dict
+    parameters: GAParameters
+    engine: str
+    cache_size: Optional[int]
+    lookup_table_threshold: int
+    generation: int
+    genotypes: np.ndarray
+    fitness: np.ndarray
+    rng_state: dict
+    total_evaluations: int
+    real_evaluations: int
+    cached_evaluations: int
+    initial_best_fitness: float
+    history: RunHistory
+    stop_reason: Optional[str] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_genotypes: Optional[np.ndarray] = None
+    cache_fitness: Optional[np.ndarray] = None
+
+    def save(self, path: str):
+        """Escribe el checkpoint de forma atómica (archivo temporal y reemplazo)"""
+        metadata = {
+            'version': CHECKPOINT_VERSION,
+            'exercise_title': self.exercise_title,
+            'strategy_params': self.strategy_params,
+            'parameters': asdict(self.parameters),
+            'engine': self.engine,
+            'cache_size': self.cache_size,
+            'lookup_table_threshold': self.lookup_table_threshold,
+            'generation': self.generation,
+            'rng_state': self.rng_state,
+            'total_evaluations': self.total_evaluations,
+            'real_evaluations': self.real_evaluations,
+            'cached_evaluations': self.cached_evaluations,
+            'initial_best_fitness': self.initial_best_fitness,
+            'stop_reason': self.stop_reason,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+        arrays = {
+            _HISTORY_PREFIX + name: array for name, array in self.history.to_arrays().items()
+        }
+        if self.cache_genotypes is not None:
+            arrays['cache_genotypes'] = self.cache_genotypes
+            arrays['cache_fitness'] = self.cache_fitness
+
+        temporary = f"{path}.tmp"
+        with open(temporary, 'wb') as file:
+            np.savez_compressed(
+                file,
+                metadata=np.array(json.dumps(metadata)),
+                genotypes=self.genotypes,
+                fitness=self.fitness,
+                **arrays
+            )
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint':
+        """Lee un checkpoint guardado con save()"""
+        with np.load(path) as data:
+            metadata = json.loads(str(data['metadata']))
+            if metadata['version'] != CHECKPOINT_VERSION:
+                raise ValueError(f"Versión de checkpoint no soportada: {metadata['version']}")
+            history = RunHistory.from_arrays({
+                name[len(_HISTORY_PREFIX):]: data[name]
+                for name in data.files if name.startswith(_HISTORY_PREFIX)
+            })
+            genotypes = data['genotypes']
+            fitness = data['fitness']
+            has_cache = 'cache_genotypes' in data.files
+            cache_genotypes = data['cache_genotypes'] if has_cache else None
+            cache_fitness = data['cache_fitness'] if has_cache else None
+
+        return cls(
+            exercise_title=metadata['exercise_title'],
+            strategy_params=metadata['strategy_params'],
+            parameters=GAParameters(**metadata['parameters']),
+            engine=metadata['engine'],
+            cache_size=metadata['cache_size'],
+            lookup_table_threshold=metadata['lookup_table_threshold'],
+            generation=metadata['generation'],
+            genotypes=genotypes,
+            fitness=fitness,
+            rng_state=metadata['rng_state'],
+            total_evaluations=metadata['total_evaluations'],
+            real_evaluations=metadata['real_evaluations'],
+            cached_evaluations=metadata['cached_evaluations'],
+            initial_best_fitness=metadata['initial_best_fitness'],
+            history=history,
+            stop_reason=metadata['stop_reason'],
+            cache_hits=metadata['cache_hits'],
+            cache_misses=metadata['cache_misses'],
+            cache_genotypes=cache_genotypes,
+            cache_fitness=cache_fitness,
+        )
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""
+Motores de generación del algoritmo genético
+
+- IndividualEngine: población como lista de objetos Individual (motor clásico)
+- PopulationMatrixEngine: población como matriz (population_size, num_bits)
+  y cada generación como operaciones NumPy sobre la matriz completa
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.individual import Individual
+from domain.entities.population import Population
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.random_streams import RandomSource, create_rng
+from infrastructure.genetic_operations.fitness_evaluation import GenotypeEvaluator
+from application.use_cases.phase_timers import PhaseTimer
+
+
+def _check_initial_size(genotypes: np.ndarray, parameters: GAParameters):
+    """Valida el tamaño de una población inicial dada"""
+    if len(genotypes) != parameters.population_size:
+        raise ValueError(
+            f"La población inicial tiene {len(genotypes)} individuos "
+            f"(se esperaban {parameters.population_size})"
+        )
+
+
+class IndividualEngine:
+    """Motor clásico: opera individuo por individuo con las estrategias"""
+
+    name = "individual"
+
+    def __init__(self, selection_strategy, crossover_strategy,
+                 mutation_strategy, survivor_selection, rng: RandomSource = None,
+                 timer: Optional[PhaseTimer] = None):
+        self.selection_strategy = selection_strategy
+        self.crossover_strategy = crossover_strategy
+        self.mutation_strategy = mutation_strategy
+        self.survivor_selection = survivor_selection
+        self.rng = create_rng(rng)
+        self.timer = timer or PhaseTimer(enabled=False)
+
+        self.parameters = None
+        self.evaluator = None
+        self.population = None
+
+    def initialize(self, parameters: GAParameters, evaluator: GenotypeEvaluator,
+                   genotypes: Optional[np.ndarray] = None,
+                   fitness: Optional[np.ndarray] = None, generation: int = 0) -> int:
+        """
+        Crea y evalúa la población inicial; devuelve evaluaciones realizadas.
+
+        Con `genotypes` se parte de esa población; si además se da `fitness`
+        no se vuelve a evaluar. `generation` es el número de la generación
+        inicial (el del checkpoint al reanudar).
+        """
+        self.parameters = parameters
+        self.evaluator = evaluator
+        if genotypes is None:
+            self.population = Population.create_random(
+                size=parameters.population_size,
+                num_bits=evaluator.num_bits,
+                generation=generation,
+                rng=self.rng
+            )
+        else:
+            _check_initial_size(genotypes, parameters)
+            self.population = Population(
+                individuals=[Individual(bits, evaluator.num_bits) for bits in genotypes.tolist()],
+                generation=generation
+            )
+
+        if fitness is not None:
+            self.population.update_fitness(fitness)
+            return 0
+
+        start = self.timer.start()
+        self._evaluate_population(self.population)
+        self.timer.stop('evaluation', start)
+        return len(self.population)
+
+    def step(self, generation: int) -> int:
+        """Avanza una generación; devuelve evaluaciones realizadas"""
+        # Nueva generación
+        new_population = self._create_next_generation(self.population, generation)
+
+        # Evaluar
+        start = self.timer.start()
+        self._evaluate_population(new_population)
+        self.timer.stop('evaluation', start)
+
+        # Supervivientes
+        start = self.timer.start()
+        self.population = self._apply_survivor_selection(
+            new_population, self.parameters.population_size
+        )
+        self.timer.stop('survivor_selection', start)
+        self.population.generation = generation
+        return len(new_population)
+
+    def get_population(self) -> Population:
+        """Población actual"""
+        return self.population
+
+    def get_best_individual(self) -> Individual:
+        """Mejor individuo actual"""
+        return self.population.get_best_individual()
+
+    def get_genotypes(self) -> np.ndarray:
+        """Genotipos enteros de la población actual"""
+        return np.fromiter(
+            (ind.bits for ind in self.population), dtype=np.int64, count=len(self.population)
+        )
+
+    def get_fitness(self) -> np.ndarray:
+        """Fitness de la población actual"""
+        return np.fromiter(
+            (ind.fitness for ind in self.population), dtype=float, count=len(self.population)
+        )
+
+    def _evaluate_population(self, population: Population):
+        """Evalúa fitness de población"""
+        genotypes = np.fromiter(
+            (ind.bits for ind in population), dtype=np.int64, count=len(population)
+        )
+        population.update_fitness(self.evaluator.evaluate(genotypes))
+
+    def _create_next_generation(self, current_population: Population, generation: int) -> Population:
+        """Crea siguiente generación"""
+        parameters = self.parameters
+        timer = self.timer
+
+        # Selección de padres
+        start = timer.start()
+        parents = self.selection_strategy.select(
+            current_population, parameters.population_size, rng=self.rng
+        )
+        timer.stop('parent_selection', start)
+        timer.count_avoided('parent_selection', len(parents))
+
+        # Descendencia
+        offspring = []
+        shared_crossover = 0
+        shared_mutation = 0
+
+        i = 0
+        while len(offspring) < parameters.population_size:
+            parent1 = parents[i % len(parents)]
+            parent2 = parents[(i + 1) % len(parents)]
+
+            # Cruzamiento
+            start = timer.start()
+            child1, child2 = self.crossover_strategy.crossover(
+                parent1, parent2, parameters.crossover_probability, rng=self.rng
+            )
+            timer.stop('crossover', start)
+            shared_crossover += (child1 is parent1) + (child2 is parent2)
+
+            # Mutación
+            start = timer.start()
+            mutated1 = self.mutation_strategy.mutate(
+                child1, parameters.mutation_x_probability, rng=self.rng
+            )
+            mutated2 = self.mutation_strategy.mutate(
+                child2, parameters.mutation_g_probability, rng=self.rng
+            )
+            timer.stop('mutation', start)
+            shared_mutation += (mutated1 is child1) + (mutated2 is child2)
+            child1, child2 = mutated1, mutated2
+
+            offspring.append(child1)
+            if len(offspring) < parameters.population_size:
+                offspring.append(child2)
+
+            i += 1
+
+        timer.count_avoided('crossover', shared_crossover)
+        timer.count_avoided('mutation', shared_mutation)
+        return Population(
+            individuals=offspring[:parameters.population_size],
+            generation=generation
+        )
+
+    def _apply_survivor_selection(self, population: Population, target_size: int) -> Population:
+        """Aplica selección de supervivientes"""
+        survivors = self.survivor_selection.select(population, target_size)
+        self.timer.count_avoided('survivor_selection', len(survivors))
+        return Population(
+            individuals=survivors[:target_size],
+            generation=population.generation
+        )
+
+
+class PopulationMatrixEngine:
+    """
+    Motor matricial: la población es una matriz uint8 (population_size, num_bits).
+
+    Reproduce la semántica del motor clásico (emparejamiento con umbral PC,
+    cruzamiento de dos puntos, mutación por intercambio con PMI/PMG y poda de
+    los peores) con operaciones por lotes; los resultados coinciden en
+    distribución, no bit a bit, porque el orden de consumo aleatorio cambia.
+    """
+
+    name = "matrix"
+
+    def __init__(self, selection_strategy, crossover_strategy,
+                 mutation_strategy, survivor_selection, rng: RandomSource = None,
+                 timer: Optional[PhaseTimer] = None):
+        self.selection_strategy = selection_strategy
+        self.crossover_strategy = crossover_strategy
+        self.mutation_strategy = mutation_strategy
+        self.survivor_selection = survivor_selection
+        self.rng = create_rng(rng)
+        self.timer = timer or PhaseTimer(enabled=False)
+
+        self.parameters = None
+        self.evaluator = None
+        self.num_bits = 0
+        self.genes = None
+        self.fitness = None
+        self.generation = 0
+        self._powers = None
+
+    def initialize(self, parameters: GAParameters, evaluator: GenotypeEvaluator,
+                   genotypes: Optional[np.ndarray] = None,
+                   fitness: Optional[np.ndarray] = None, generation: int = 0) -> int:
+        """
+        Crea y evalúa la población inicial; devuelve evaluaciones realizadas.
+
+        Con `genotypes` se parte de esa población; si además se da `fitness`
+        no se vuelve a evaluar. `generation` es el número de la generación
+        inicial (el del checkpoint al reanudar).
+        """
+        num_bits = evaluator.num_bits
+
+        self.parameters = parameters
+        self.evaluator = evaluator
+        self.num_bits = num_bits
+        self.generation = generation
+        self._powers = np.left_shift(1, np.arange(num_bits - 1, -1, -1, dtype=np.int64))
+
+        if genotypes is None:
+            self.genes = self.rng.integers(
+                0, 2, size=(parameters.population_size, num_bits), dtype=np.uint8
+            )
+        else:
+            _check_initial_size(genotypes, parameters)
+            self.genes = self.encode_genotypes(genotypes)
+
+        if fitness is not None:
+            self.fitness = np.array(fitness, dtype=float)
+            return 0
+
+        start = self.timer.start()
+        self.fitness = self._evaluate(self.genes)
+        self.timer.stop('evaluation', start)
+        return len(self.fitness)
+
+    def step(self, generation: int) -> int:
+        """Avanza una generación; devuelve evaluaciones realizadas"""
+        parameters = self.parameters
+        size = parameters.population_size
+        timer = self.timer
+
+        start = timer.start()
+        parent_idx = self._select_parents(size)
+        timer.stop('parent_selection', start)
+
+        start = timer.start()
+        offspring = self._crossover(parent_idx, parameters.crossover_probability, size)
+        timer.stop('crossover', start)
+
+        start = timer.start()
+        offspring = self._mutate(offspring)
+        timer.stop('mutation', start)
+
+        start = timer.start()
+        offspring_fitness = self._evaluate(offspring)
+        timer.stop('evaluation', start)
+
+        start = timer.start()
+        self.genes, self.fitness = self._truncate(offspring, offspring_fitness, size)
+        timer.stop('survivor_selection', start)
+        self.generation = generation
+        return len(offspring_fitness)
+
+    def encode_genotypes(self, genotypes: np.ndarray) -> np.ndarray:
+        """Matriz de bits a partir de genotipos enteros"""
+        genotypes = np.asarray(genotypes, dtype=np.int64)
+        shifts = np.arange(self.num_bits - 1, -1, -1, dtype=np.int64)
+        return ((genotypes[:, None] >> shifts) & 1).astype(np.uint8)
+
+    def decode_genotypes(self, genes: np.ndarray) -> np.ndarray:
+        """Genotipos enteros a partir de la matriz de bits (gen 0 = bit más significativo)"""
+        return genes @ self._powers
+
+    def get_population(self) -> Population:
+        """Población actual como objetos (se construye bajo demanda)"""
+        genotypes = self.decode_genotypes(self.genes).tolist()
+        individuals = [
+            Individual(bits, self.num_bits, fitness)
+            for bits, fitness in zip(genotypes, self.fitness.tolist())
+        ]
+        return Population(individuals=individuals, generation=self.generation)
+
+    def get_best_individual(self) -> Individual:
+        """Mejor individuo actual"""
+        best = int(np.argmax(self.fitness))
+        bits = int(self.decode_genotypes(self.genes[best]))
+        return Individual(bits, self.num_bits, float(self.fitness[best]))
+
+    def get_genotypes(self) -> np.ndarray:
+        """Genotipos enteros de la población actual"""
+        return self.decode_genotypes(self.genes)
+
+    def get_fitness(self) -> np.ndarray:
+        """Fitness de la población actual"""
+        return self.fitness
+
+    def _evaluate(self, genes: np.ndarray) -> np.ndarray:
+        """Evalúa fitness de toda la matriz"""
+        return self.evaluator.evaluate(self.decode_genotypes(genes))
+
+    def _select_parents(self, num_parents: int) -> np.ndarray:
+        """Índices de los padres según la estrategia de selección"""
+        return self.selection_strategy.select_indices(
+            int(np.argmax(self.fitness)), len(self.fitness), num_parents, rng=self.rng
+        )
+
+    def _crossover(self, parent_idx: np.ndarray, probability: float, size: int) -> np.ndarray:
+        """Cruzamiento de dos puntos sobre todos los pares (i, i+1) a la vez"""
+        pair = np.arange((size + 1) // 2)
+        pairs = np.stack(
+            (parent_idx[pair % len(parent_idx)], parent_idx[(pair + 1) % len(parent_idx)]),
+            axis=1
+        )
+        offspring = self.crossover_strategy.crossover_batch(
+            self.genes, pairs, probability, rng=self.rng
+        )
+        return offspring[:size]
+
+    def _mutate(self, genes: np.ndarray) -> np.ndarray:
+        """Mutación por intercambio: parejas aleatorias entre los genes elegidos por PMG"""
+        return self.mutation_strategy.mutate_batch(genes, rng=self.rng)
+
+    def _truncate(self, genes: np.ndarray, fitness: np.ndarray, target_size: int):
+        """Poda de los peores con selección parcial (argpartition)"""
+        if len(fitness) <= target_size:
+            return genes, fitness
+
+        kept = self.survivor_selection.survivor_indices(fitness, target_size)
+        return genes[kept], fitness[kept]
\ No newline at end of file
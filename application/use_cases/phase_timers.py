@@ -0,0 +1,82 @@
+"""
+Temporizadores por fase de cada generación del algoritmo genético
+"""
+
+import time
+
+import numpy as np
+
+
+# Fases medidas en cada generación
+PHASES = (
+    'parent_selection', 'crossover', 'mutation', 'evaluation',
+    'survivor_selection', 'history',
+)
+
+
+class PhaseTimer:
+    """
+    Acumula segundos por fase en la generación en curso y guarda una fila
+    por generación al cerrarla con end_generation().
+
+    Desactivado, start() y stop() no leen el reloj, de modo que los motores
+    pueden llamarlos siempre.
+
+    También cuenta por fase las asignaciones evitadas: individuos que se
+    comparten por referencia en lugar de copiarse o recrearse.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._rows = []
+        self._avoided = dict.fromkeys(PHASES, 0)
+
+    def start(self) -> float:
+        """Marca de tiempo de inicio de una fase"""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, phase: str, start: float):
+        """Suma a `phase` el tiempo transcurrido desde `start`"""
+        if self.enabled:
+            self._current[phase] += time.perf_counter() - start
+
+    def count_avoided(self, phase: str, amount: int):
+        """Suma `amount` asignaciones evitadas a `phase`"""
+        if self.enabled:
+            self._avoided[phase] += amount
+
+    def allocations_avoided(self) -> dict:
+        """Asignaciones evitadas por fase (solo las fases con alguna) y total"""
+        counts = {phase: count for phase, count in self._avoided.items() if count}
+        counts['total'] = sum(counts.values())
+        return counts
+
+    def current(self) -> dict:
+        """Segundos por fase de la generación en curso"""
+        return dict(self._current)
+
+    def end_generation(self):
+        """Cierra la generación en curso"""
+        if self.enabled:
+            self._rows.append([self._current[phase] for phase in PHASES])
+            self._current = dict.fromkeys(PHASES, 0.0)
+
+    @property
+    def num_generations(self) -> int:
+        """Generaciones cerradas"""
+        return len(self._rows)
+
+    def summary(self) -> dict:
+        """Total, media y percentil 95 por generación de cada fase"""
+        if not self._rows:
+            return {}
+        rows = np.array(self._rows)
+        return {
+            phase: {
+                'total': float(rows[:, i].sum()),
+                'mean': float(rows[:, i].mean()),
+                'p95': float(np.percentile(rows[:, i], 95)),
+            }
+            for i, phase in enumerate(PHASES)
+        }
\ No newline at end of file
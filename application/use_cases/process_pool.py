@@ -0,0 +1,29 @@
+"""
+Utilidades compartidas para ejecutar casos de uso en procesos trabajadores
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# IMPORTACIÓN ABSOLUTA
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+
+
+# Casos de uso ya creados en cada proceso
+_USE_CASES = {}
+
+
+def get_use_case(exercise_key: Optional[str],
+                 strategy_params: Optional[dict] = None) -> RunExerciseGeneticAlgorithm:
+    """Caso de uso del ejercicio (y parámetros de estrategia), reutilizado dentro del proceso"""
+    key = (exercise_key, tuple(sorted((strategy_params or {}).items())))
+    if key not in _USE_CASES:
+        _USE_CASES[key] = RunExerciseGeneticAlgorithm(exercise_key, strategy_params)
+    return _USE_CASES[key]
+
+
+def create_executor(max_workers: Optional[int]) -> Optional[ProcessPoolExecutor]:
+    """Pool de procesos; None si max_workers es 0 (ejecución en el proceso actual)"""
+    if max_workers == 0:
+        return None
+    return ProcessPoolExecutor(max_workers=max_workers)
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Reporte de progreso limitado por frecuencia
+
+El callback conserva la firma progress_callback(generación, total,
+mejor fitness, info); info lleva las métricas de la generación entregada.
+"""
+
+import time
+from typing import Callable, Optional
+
+# Intervalo mínimo por defecto entre llamadas al callback (20 Hz)
+DEFAULT_PROGRESS_INTERVAL = 0.05
+
+
+class ProgressReporter:
+    """
+    Entrega snapshots al callback como máximo una vez cada `interval`
+    segundos; la primera generación y la final siempre se entregan.
+
+    Claves de info: best_value, best_x, mean_fitness, worst_fitness,
+    diversity, hamming_diversity, total_evaluations, real_evaluations, elapsed,
+    generations_per_second, final, stop_reason y, si se miden,
+    phase_times (segundos por fase de la generación).
+    """
+
+    def __init__(self, callback: Optional[Callable], interval: float = DEFAULT_PROGRESS_INTERVAL,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.callback = callback
+        self.interval = interval
+        self.clock = clock
+        self.delivered = 0
+        self._start = clock()
+        self._last = None
+
+    def report(self, snapshot, phase_times: Optional[dict] = None):
+        """Entrega el snapshot si pasó el intervalo o si es el final"""
+        if self.callback is None:
+            return
+        final = snapshot.stop_reason is not None
+        now = self.clock()
+        if not final and self._last is not None and now - self._last < self.interval:
+            return
+        self._last = now
+
+        elapsed = now - self._start
+        info = {
+            'best_value': snapshot.best_value,
+            'best_x': snapshot.best_x,
+            'mean_fitness': snapshot.mean_fitness,
+            'worst_fitness': snapshot.worst_fitness,
+            'diversity': snapshot.diversity,
+            'hamming_diversity': snapshot.hamming_diversity,
+            'total_evaluations': snapshot.total_evaluations,
+            'real_evaluations': snapshot.real_evaluations,
+            'elapsed': elapsed,
+            'generations_per_second': snapshot.generation / elapsed if elapsed > 0 else 0.0,
+            'final': final,
+            'stop_reason': snapshot.stop_reason,
+        }
+        if phase_times is not None:
+            info['phase_times'] = phase_times
+
+        self.delivered += 1
+        self.callback(snapshot.generation, snapshot.num_generations, snapshot.best_fitness, info)
\ No newline at end of file
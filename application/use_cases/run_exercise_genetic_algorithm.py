@@ -2,17 +2,38 @@
 Caso de uso para ejecutar algoritmo genético según configuración de ejercicio
 """
 
-from typing import Optional, Callable
-from dataclasses import dataclass
+from typing import Optional, Callable, Iterator, Sequence, Union
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+
+import numpy as np
 
 # IMPORTACIONES ABSOLUTAS (SIN ... ni ..)
 from domain.entities.individual import Individual
-from domain.entities.population import Population
+from domain.entities.population import Population, hamming_diversity
 from domain.entities.ga_parameters import GAParameters
+from domain.entities.run_history import RunHistory
+from domain.entities.random_streams import RandomSource, get_rng_state, rng_from_state
 from config.exercises import ExerciseConfig, ExerciseManager
 from infrastructure.genetic_operations.exercise_specific_functions import FunctionFactory
 from infrastructure.genetic_operations.exercise_specific_strategies import StrategyFactory
 from infrastructure.genetic_operations.crossover_strategies import TwoPointCrossover
+from infrastructure.genetic_operations.fitness_evaluation import (
+    GenotypeEvaluator, FitnessLookupTable, DEFAULT_LOOKUP_TABLE_THRESHOLD
+)
+from application.use_cases.generation_engines import IndividualEngine, PopulationMatrixEngine
+from application.use_cases.termination_criteria import (
+    MAX_GENERATIONS, CANCELLED, CancellationToken
+)
+from application.use_cases.checkpoints import Checkpoint
+from application.use_cases.phase_timers import PhaseTimer
+from application.use_cases.progress_reporting import ProgressReporter, DEFAULT_PROGRESS_INTERVAL
+
+
+ENGINES = {
+    IndividualEngine.name: IndividualEngine,
+    PopulationMatrixEngine.name: PopulationMatrixEngine,
+}
 
 
 @dataclass
@@ -23,30 +44,151 @@ class ExerciseResult:
     best_x: float
     best_fitness: float
     final_population: Population
-    population_history: list
-    fitness_history: list
-    best_fitness_history: list
+    history: RunHistory
     parameters: GAParameters
     total_evaluations: int
     improvement: float
     exercise_config: ExerciseConfig
     original_best_value: float
     is_minimization: bool
+    real_evaluations: int = 0  # Llamadas reales a la función objetivo
+    cached_evaluations: int = 0  # Evaluaciones resueltas por caché o tabla
+    table_evaluations: int = 0  # Evaluaciones para construir la tabla completa
+    cache_hits: int = 0
+    cache_misses: int = 0
+    lookup_table: Optional[FitnessLookupTable] = None
+    stop_reason: str = MAX_GENERATIONS
+    generations_run: int = 0
+    phase_timings: Optional[dict] = None
+    allocations_avoided: Optional[dict] = None
+    
+    @property
+    def population_history(self):
+        """Poblaciones por generación (se reconstruyen al accederlas)"""
+        return self.history.population_view()
+    
+    @property
+    def fitness_history(self):
+        """Listas de fitness por generación (se reconstruyen al accederlas)"""
+        return self.history.fitness_view()
+    
+    @property
+    def best_fitness_history(self) -> list:
+        """Mejor fitness por generación"""
+        return self.history.best_fitness_list()
     
     def get_display_result(self) -> float:
         """Resultado a mostrar"""
         return self.original_best_value
+    
+    def to_dict(self) -> dict:
+        """Representación serializable (JSON) sin poblaciones"""
+        history = self.history
+        curves = {}
+        if history.has_best():
+            curves['best_fitness'] = history.best_fitness_list()
+        if history.has_summary():
+            count = history.num_stats
+            curves['mean_fitness'] = history.mean_fitness[:count].tolist()
+            curves['worst_fitness'] = history.worst_fitness[:count].tolist()
+            curves['std_fitness'] = history.std_fitness[:count].tolist()
+            curves['diversity'] = history.diversity[:count].tolist()
+            curves['hamming_diversity'] = history.hamming_diversity[:count].tolist()
+        
+        return {
+            'exercise': self.exercise_config.title,
+            'objective_type': self.exercise_config.objective_type,
+            'parameters': vars(self.parameters),
+            'best_x': self.best_x,
+            'best_value': self.original_best_value,
+            'best_fitness': self.best_fitness,
+            'best_genes': self.best_individual.get_binary_string(),
+            'improvement': self.improvement,
+            'stop_reason': self.stop_reason,
+            'generations_run': self.generations_run,
+            'total_evaluations': self.total_evaluations,
+            'real_evaluations': self.real_evaluations,
+            'cached_evaluations': self.cached_evaluations,
+            'table_evaluations': self.table_evaluations,
+            'phase_timings': self.phase_timings,
+            'allocations_avoided': self.allocations_avoided,
+            'curves': curves,
+        }
+
+
+@dataclass
+class GenerationSnapshot:
+    """
+    Estado ligero de una generación.
+    
+    genotypes y fitness son arreglos de la generación actual (no se modifican
+    después); population solo se incluye si se pide explícitamente.
+    stop_reason solo se fija en la última generación de la ejecución.
+    
+    Las estadísticas O(n) (media, peor y desviación del fitness y las dos
+    diversidades) se calculan al leerlas por primera vez, de modo que una
+    ejecución sin historial, criterios ni reporte no las paga.
+    """
+    
+    generation: int
+    num_generations: int
+    best_genotype: int
+    best_x: float
+    best_fitness: float
+    best_value: float
+    total_evaluations: int
+    real_evaluations: int
+    cached_evaluations: int
+    genotypes: np.ndarray
+    fitness: np.ndarray
+    population: Optional[Population] = None
+    stop_reason: Optional[str] = None
+    evaluator: Optional[GenotypeEvaluator] = field(default=None, repr=False, compare=False)
+    
+    @cached_property
+    def mean_fitness(self) -> float:
+        """Fitness medio"""
+        return float(self.fitness.mean())
+    
+    @cached_property
+    def worst_fitness(self) -> float:
+        """Peor fitness"""
+        return float(self.fitness.min())
+    
+    @cached_property
+    def std_fitness(self) -> float:
+        """Desviación del fitness"""
+        return float(self.fitness.std())
+    
+    @cached_property
+    def diversity(self) -> float:
+        """Desviación de x (la misma medida que Population.get_diversity)"""
+        if len(self.genotypes) < 2:
+            return 0.0
+        return float(self.evaluator.decode(self.genotypes).std(ddof=1))
+    
+    @cached_property
+    def hamming_diversity(self) -> float:
+        """Distancia de Hamming media entre pares (Population.get_hamming_diversity)"""
+        return hamming_diversity(self.genotypes, self.evaluator.num_bits)
 
 
 class RunExerciseGeneticAlgorithm:
     """Caso de uso para ejecutar AG según ejercicio"""
     
-    def __init__(self, exercise_key: str = None):
+    def __init__(self, exercise_key: str = None, strategy_params: Optional[dict] = None):
         if exercise_key:
             self.exercise_config = ExerciseManager.get_exercise(exercise_key)
         else:
             self.exercise_config = ExerciseManager.get_current_exercise()
         
+        # Parámetros de estrategia que reemplazan a los del ejercicio
+        if strategy_params:
+            self.exercise_config = replace(
+                self.exercise_config,
+                strategy_params={**self.exercise_config.strategy_params, **strategy_params}
+            )
+        
         self._setup_components()
     
     def _setup_components(self):
@@ -76,9 +218,47 @@ class RunExerciseGeneticAlgorithm:
     def execute(
         self, 
         custom_parameters: Optional[GAParameters] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        engine: str = "individual",
+        cache_size: Optional[int] = None,
+        lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+        recording: str = "full",
+        record_every: int = 1,
+        termination: Optional[Sequence] = None,
+        seed: RandomSource = None,
+        timing: bool = False,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        cancellation: Optional[CancellationToken] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 0
     ) -> ExerciseResult:
-        """Ejecuta el algoritmo genético"""
+        """
+        Ejecuta el algoritmo genético.
+        
+        engine: "individual" (objetos Individual) o "matrix" (matriz NumPy por generación)
+        cache_size: tamaño de la caché LRU de fitness por genotipo (None la desactiva)
+        lookup_table_threshold: si 2^num_bits no lo supera se precalcula la tabla
+            completa de fitness (0 la desactiva)
+        recording: nivel de registro del historial ("none", "best", "summary",
+            "every_k" o "full"; ver RunHistory)
+        record_every: cada cuántas generaciones se guarda la población con "every_k"
+        termination: criterios de parada anticipada (ver termination_criteria);
+            el que se active queda en ExerciseResult.stop_reason
+        seed: semilla, SeedSequence o numpy.random.Generator de la ejecución
+            (None usa un flujo nuevo; ver random_streams)
+        timing: mide el tiempo de cada fase por generación; el resumen queda en
+            ExerciseResult.phase_timings, las asignaciones evitadas (individuos
+            compartidos por referencia) en ExerciseResult.allocations_avoided y
+            cada generación llega al progress_callback como info['phase_times']
+        progress_interval: segundos mínimos entre llamadas a progress_callback
+            (0 la llama en cada generación; la final siempre se entrega).
+            Las métricas de info se describen en ProgressReporter.
+        cancellation: token para detener la ejecución desde otro hilo; el
+            resultado parcial queda con stop_reason "cancelled"
+        checkpoint_path: archivo .npz donde guardar checkpoints (ver resume)
+        checkpoint_every: cada cuántas generaciones se guarda; con 0 solo se
+            guarda al terminar (incluida la cancelación)
+        """
         
         # Parámetros
         if custom_parameters:
@@ -87,7 +267,62 @@ class RunExerciseGeneticAlgorithm:
             parameters = self._create_default_parameters()
         
         # Ejecutar algoritmo
-        result = self._run_algorithm(parameters, progress_callback)
+        result = self._run_algorithm(
+            parameters, progress_callback, engine, cache_size, lookup_table_threshold,
+            recording, record_every, termination, seed, timing, progress_interval,
+            cancellation=cancellation, checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every
+        )
+        return self._create_result(result)
+    
+    def resume(
+        self,
+        checkpoint: Union[str, Checkpoint],
+        progress_callback: Optional[Callable] = None,
+        termination: Optional[Sequence] = None,
+        timing: bool = False,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        cancellation: Optional[CancellationToken] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 0
+    ) -> ExerciseResult:
+        """
+        Continúa una ejecución desde un checkpoint (ruta o Checkpoint).
+        
+        Con los mismos criterios de parada el resultado (incluidos los
+        contadores de evaluaciones y de la caché) es idéntico al de la
+        ejecución sin interrumpir. Los criterios se reinician al reanudar.
+        Si checkpoint es una ruta y no se da checkpoint_path, los nuevos
+        checkpoints se escriben en el mismo archivo.
+        
+        Una ejecución que ya terminó (checkpoint final, no cancelado) no se
+        continúa: se devuelve tal cual con su stop_reason.
+        """
+        if isinstance(checkpoint, str):
+            checkpoint_path = checkpoint_path or checkpoint
+            checkpoint = Checkpoint.load(checkpoint)
+        
+        if checkpoint.exercise_title != self.exercise_config.title:
+            raise ValueError(
+                f"El checkpoint es del ejercicio '{checkpoint.exercise_title}' "
+                f"(actual: '{self.exercise_config.title}')"
+            )
+        if checkpoint.strategy_params != self.exercise_config.strategy_params:
+            raise ValueError("Los parámetros de estrategia no coinciden con los del checkpoint")
+        
+        history = checkpoint.history
+        result = self._run_algorithm(
+            checkpoint.parameters, progress_callback, checkpoint.engine,
+            checkpoint.cache_size, checkpoint.lookup_table_threshold,
+            history.level, history.every, termination, rng_from_state(checkpoint.rng_state),
+            timing, progress_interval,
+            cancellation=cancellation, checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every, resume_from=checkpoint
+        )
+        return self._create_result(result)
+    
+    def _create_result(self, result: dict) -> ExerciseResult:
+        """ExerciseResult a partir del diccionario de _run_algorithm"""
         
         # Calcular valor original
         original_value = self.objective_function.evaluate_original(result['best_x'])
@@ -99,15 +334,57 @@ class RunExerciseGeneticAlgorithm:
             best_x=result['best_x'],
             best_fitness=result['best_fitness'],
             final_population=result['final_population'],
-            population_history=result['population_history'],
-            fitness_history=result['fitness_history'],
-            best_fitness_history=result['best_fitness_history'],
+            history=result['history'],
             parameters=result['parameters'],
             total_evaluations=result['total_evaluations'],
             improvement=result['improvement'],
             exercise_config=self.exercise_config,
             original_best_value=original_value,
-            is_minimization=is_minimization
+            is_minimization=is_minimization,
+            real_evaluations=result['real_evaluations'],
+            cached_evaluations=result['cached_evaluations'],
+            table_evaluations=result['table_evaluations'],
+            cache_hits=result['cache_hits'],
+            cache_misses=result['cache_misses'],
+            lookup_table=result['lookup_table'],
+            stop_reason=result['stop_reason'],
+            generations_run=result['generations_run'],
+            phase_timings=result['phase_timings'],
+            allocations_avoided=result['allocations_avoided']
+        )
+    
+    def iterate(
+        self,
+        custom_parameters: Optional[GAParameters] = None,
+        engine: str = "individual",
+        cache_size: Optional[int] = None,
+        lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+        include_population: bool = False,
+        termination: Optional[Sequence] = None,
+        seed: RandomSource = None,
+        initial_genotypes: Optional[np.ndarray] = None,
+        initial_fitness: Optional[np.ndarray] = None,
+        evaluator: Optional[GenotypeEvaluator] = None
+    ) -> Iterator[GenerationSnapshot]:
+        """
+        Ejecuta el algoritmo genético generación por generación.
+        
+        Produce un GenerationSnapshot por generación (la 0 es la población
+        inicial) sin guardar historial; dejar de iterar detiene la ejecución.
+        initial_genotypes/initial_fitness permiten continuar desde una
+        población existente (p. ej. una isla tras una migración) y
+        `evaluator` reutilizar un evaluador ya creado, con su tabla y su
+        caché (cache_size y lookup_table_threshold se ignoran entonces).
+        """
+        parameters = custom_parameters or self._create_default_parameters()
+        generation_engine = self._create_engine(engine, seed)
+        if evaluator is None:
+            evaluator = GenotypeEvaluator(
+                self.objective_function, parameters, cache_size, lookup_table_threshold
+            )
+        return self._iterate_run(
+            parameters, generation_engine, evaluator, include_population, termination,
+            initial_genotypes, initial_fitness
         )
     
     def _create_default_parameters(self) -> GAParameters:
@@ -124,133 +401,240 @@ class RunExerciseGeneticAlgorithm:
             mutation_g_probability=config.default_mutation_prob
         )
     
-    def _run_algorithm(self, parameters: GAParameters, progress_callback=None) -> dict:
-        """Ejecuta el algoritmo genético"""
-        
-        # Calcular bits
-        num_bits = parameters.calculate_num_bits()
+    def _create_engine(self, engine: str, seed: RandomSource = None,
+                       timer: Optional[PhaseTimer] = None):
+        """Crea motor de generación según nombre"""
+        engine_class = ENGINES.get(engine)
+        if engine_class is None:
+            raise ValueError(
+                f"Motor desconocido: {engine} (disponibles: {', '.join(ENGINES)})"
+            )
         
-        # Población inicial
-        current_population = Population.create_random(
-            size=parameters.population_size,
-            num_bits=num_bits,
-            generation=0
+        strategies = (
+            self.selection_strategy,
+            self.crossover_strategy,
+            self.mutation_strategy,
+            self.survivor_selection
         )
+        return engine_class(*strategies, rng=seed, timer=timer)
+    
+    def _iterate_run(self, parameters: GAParameters, generation_engine,
+                     evaluator: GenotypeEvaluator, include_population: bool = False,
+                     termination: Optional[Sequence] = None,
+                     initial_genotypes: Optional[np.ndarray] = None,
+                     initial_fitness: Optional[np.ndarray] = None,
+                     start_generation: int = 0,
+                     initial_evaluations: int = 0,
+                     stop_reason: Optional[str] = None) -> Iterator[GenerationSnapshot]:
+        """
+        Inicializa y avanza el motor produciendo un snapshot por generación.
         
-        # Historial
-        population_history = []
-        fitness_history = []
-        best_fitness_history = []
-        total_evaluations = 0
-        
-        # Evaluar población inicial
-        self._evaluate_population(current_population, parameters)
-        total_evaluations += len(current_population)
+        Con stop_reason la ejecución ya terminó: solo se produce el snapshot
+        inicial, con ese motivo de parada.
+        """
         
-        # Guardar estado inicial
-        initial_best_fitness = current_population.get_best_fitness()
-        population_history.append(current_population.copy())
-        fitness_history.append([ind.fitness for ind in current_population])
-        best_fitness_history.append(initial_best_fitness)
+        criteria = list(termination or [])
+        for criterion in criteria:
+            criterion.reset()
         
-        # Progreso inicial
-        if progress_callback:
-            progress_callback(0, parameters.num_generations, initial_best_fitness, {})
+        # Población inicial evaluada
+        total_evaluations = initial_evaluations + generation_engine.initialize(
+            parameters, evaluator, initial_genotypes, initial_fitness, start_generation
+        )
+        generation = start_generation
+        timer = generation_engine.timer
         
-        # Evolución
-        for generation in range(1, parameters.num_generations + 1):
-            # Nueva generación
-            new_population = self._create_next_generation(
-                current_population, parameters, generation
+        while True:
+            start = timer.start()
+            snapshot = self._create_snapshot(
+                generation, parameters, generation_engine, evaluator,
+                total_evaluations, include_population
             )
+            timer.stop('history', start)
+            
+            # Criterios de parada (una ejecución ya terminada conserva su motivo)
+            if stop_reason is not None:
+                snapshot.stop_reason = stop_reason
+            else:
+                for criterion in criteria:
+                    if criterion.check(snapshot):
+                        snapshot.stop_reason = criterion.name
+                        break
+                else:
+                    if generation >= parameters.num_generations:
+                        snapshot.stop_reason = MAX_GENERATIONS
             
-            # Evaluar
-            self._evaluate_population(new_population, parameters)
-            total_evaluations += len(new_population)
+            yield snapshot
+            timer.end_generation()
+            if snapshot.stop_reason:
+                return
             
-            # Supervivientes
-            surviving_population = self._apply_survivor_selection(
-                new_population, parameters.population_size
+            # Selección, cruzamiento, mutación, evaluación y supervivientes
+            generation += 1
+            total_evaluations += generation_engine.step(generation)
+    
+    def _create_snapshot(self, generation: int, parameters: GAParameters, generation_engine,
+                         evaluator: GenotypeEvaluator, total_evaluations: int,
+                         include_population: bool) -> GenerationSnapshot:
+        """Resume el estado actual del motor"""
+        genotypes = generation_engine.get_genotypes()
+        fitness = generation_engine.get_fitness()
+        best = int(np.argmax(fitness))
+        best_x = float(evaluator.decode(genotypes[best:best + 1])[0])
+        
+        return GenerationSnapshot(
+            generation=generation,
+            num_generations=parameters.num_generations,
+            best_genotype=int(genotypes[best]),
+            best_x=best_x,
+            best_fitness=float(fitness[best]),
+            best_value=self.objective_function.evaluate_original(best_x),
+            total_evaluations=total_evaluations,
+            real_evaluations=evaluator.real_evaluations,
+            cached_evaluations=evaluator.cached_evaluations,
+            genotypes=genotypes,
+            fitness=fitness,
+            population=generation_engine.get_population() if include_population else None,
+            evaluator=evaluator
+        )
+    
+    def _run_algorithm(self, parameters: GAParameters, progress_callback=None,
+                       engine: str = "individual", cache_size: Optional[int] = None,
+                       lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+                       recording: str = "full", record_every: int = 1,
+                       termination: Optional[Sequence] = None,
+                       seed: RandomSource = None, timing: bool = False,
+                       progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+                       cancellation: Optional[CancellationToken] = None,
+                       checkpoint_path: Optional[str] = None, checkpoint_every: int = 0,
+                       resume_from: Optional[Checkpoint] = None) -> dict:
+        """Ejecuta el algoritmo genético (o lo continúa desde `resume_from`)"""
+        
+        timer = PhaseTimer(enabled=timing)
+        generation_engine = self._create_engine(engine, seed, timer)
+        evaluator = GenotypeEvaluator(
+            self.objective_function, parameters, cache_size, lookup_table_threshold
+        )
+        criteria = list(termination or [])
+        if cancellation is not None:
+            criteria.append(cancellation)
+        
+        if resume_from is None:
+            history = RunHistory(
+                parameters.num_generations, parameters.population_size, evaluator.num_bits,
+                level=recording, every=record_every
             )
+            initial_best_fitness = None
+            snapshots = self._iterate_run(
+                parameters, generation_engine, evaluator, termination=criteria
+            )
+        else:
+            # La generación del checkpoint ya está registrada: se continúa tras ella
+            history = resume_from.history
+            initial_best_fitness = resume_from.initial_best_fitness
+            evaluator.real_evaluations = resume_from.real_evaluations
+            evaluator.cached_evaluations = resume_from.cached_evaluations
+            if evaluator.cache is not None and resume_from.cache_genotypes is not None:
+                evaluator.cache.restore(
+                    resume_from.cache_genotypes, resume_from.cache_fitness,
+                    resume_from.cache_hits, resume_from.cache_misses
+                )
+            finished = resume_from.stop_reason not in (None, CANCELLED)
+            snapshots = self._iterate_run(
+                parameters, generation_engine, evaluator, termination=criteria,
+                initial_genotypes=resume_from.genotypes, initial_fitness=resume_from.fitness,
+                start_generation=resume_from.generation,
+                initial_evaluations=resume_from.total_evaluations,
+                stop_reason=resume_from.stop_reason if finished else None
+            )
+        total_evaluations = 0
+        reporter = ProgressReporter(progress_callback, progress_interval)
+        
+        for snapshot in snapshots:
+            if initial_best_fitness is None:
+                initial_best_fitness = snapshot.best_fitness
+            total_evaluations = snapshot.total_evaluations
+            resumed = resume_from is not None and snapshot.generation == resume_from.generation
             
-            current_population = surviving_population
-            current_population.generation = generation
+            # Historial (la población final de una cancelación no se guarda
+            # para que una reanudación produzca el mismo historial)
+            if history.level != "none" and not resumed:
+                start = timer.start()
+                summary = history.records_summary()
+                history.record(
+                    snapshot.generation, snapshot.genotypes, snapshot.fitness,
+                    final=snapshot.stop_reason not in (None, CANCELLED),
+                    diversity=snapshot.diversity if summary else 0.0,
+                    hamming=snapshot.hamming_diversity if summary else None
+                )
+                timer.stop('history', start)
             
-            # Historial
-            population_history.append(current_population.copy())
-            fitness_history.append([ind.fitness for ind in current_population])
-            best_fitness_history.append(current_population.get_best_fitness())
+            # Checkpoint
+            if checkpoint_path and not resumed and (
+                snapshot.stop_reason is not None
+                or (checkpoint_every and snapshot.generation % checkpoint_every == 0)
+            ):
+                self._create_checkpoint(
+                    snapshot, parameters, generation_engine, evaluator, history,
+                    cache_size, lookup_table_threshold, initial_best_fitness
+                ).save(checkpoint_path)
             
             # Progreso
-            if progress_callback:
-                progress_callback(generation, parameters.num_generations, 
-                                current_population.get_best_fitness(), {})
+            reporter.report(snapshot, timer.current() if timing else None)
         
         # Resultado final
-        best_individual = current_population.get_best_individual()
+        best_individual = generation_engine.get_best_individual()
         best_x = best_individual.to_decimal(parameters.x_min, parameters.x_max)
         
         return {
             'best_individual': best_individual,
             'best_x': best_x,
             'best_fitness': best_individual.fitness,
-            'final_population': current_population,
-            'population_history': population_history,
-            'fitness_history': fitness_history,
-            'best_fitness_history': best_fitness_history,
+            'final_population': generation_engine.get_population(),
+            'history': history,
             'parameters': parameters,
             'total_evaluations': total_evaluations,
+            'real_evaluations': evaluator.real_evaluations,
+            'cached_evaluations': evaluator.cached_evaluations,
+            'table_evaluations': evaluator.table_evaluations,
+            'cache_hits': evaluator.cache_hits,
+            'cache_misses': evaluator.cache_misses,
+            'lookup_table': evaluator.lookup_table,
+            'stop_reason': snapshot.stop_reason,
+            'generations_run': snapshot.generation,
+            'phase_timings': timer.summary() if timing else None,
+            'allocations_avoided': timer.allocations_avoided() if timing else None,
             'improvement': best_individual.fitness - initial_best_fitness
         }
     
-    def _evaluate_population(self, population: Population, parameters: GAParameters):
-        """Evalúa fitness de población"""
-        for individual in population:
-            x = individual.to_decimal(parameters.x_min, parameters.x_max)
-            individual.fitness = self.objective_function.evaluate(x)
-    
-    def _create_next_generation(self, current_population: Population, parameters: GAParameters, generation: int) -> Population:
-        """Crea siguiente generación"""
-        
-        # Selección de padres
-        parents = self.selection_strategy.select(
-            current_population, parameters.population_size
-        )
-        
-        # Descendencia
-        offspring = []
-        
-        i = 0
-        while len(offspring) < parameters.population_size:
-            parent1 = parents[i % len(parents)]
-            parent2 = parents[(i + 1) % len(parents)]
-            
-            # Cruzamiento
-            child1, child2 = self.crossover_strategy.crossover(
-                parent1, parent2, parameters.crossover_probability
-            )
-            
-            # Mutación
-            child1 = self.mutation_strategy.mutate(child1, parameters.mutation_x_probability)
-            child2 = self.mutation_strategy.mutate(child2, parameters.mutation_g_probability)
-            
-            offspring.append(child1)
-            if len(offspring) < parameters.population_size:
-                offspring.append(child2)
-            
-            i += 1
-        
-        return Population(
-            individuals=offspring[:parameters.population_size],
-            generation=generation
-        )
-    
-    def _apply_survivor_selection(self, population: Population, target_size: int) -> Population:
-        """Aplica selección de supervivientes"""
-        survivors = self.survivor_selection.select(population, target_size)
-        return Population(
-            individuals=survivors[:target_size],
-            generation=population.generation
+    def _create_checkpoint(self, snapshot: GenerationSnapshot, parameters: GAParameters,
+                           generation_engine, evaluator: GenotypeEvaluator, history: RunHistory,
+                           cache_size: Optional[int], lookup_table_threshold: int,
+                           initial_best_fitness: float) -> Checkpoint:
+        """Estado actual de la ejecución"""
+        cache = evaluator.cache
+        cache_genotypes, cache_fitness = cache.entries() if cache is not None else (None, None)
+        return Checkpoint(
+            exercise_title=self.exercise_config.title,
+            strategy_params=dict(self.exercise_config.strategy_params),
+            parameters=parameters,
+            engine=generation_engine.name,
+            cache_size=cache_size,
+            lookup_table_threshold=lookup_table_threshold,
+            generation=snapshot.generation,
+            genotypes=snapshot.genotypes,
+            fitness=snapshot.fitness,
+            rng_state=get_rng_state(generation_engine.rng),
+            total_evaluations=snapshot.total_evaluations,
+            real_evaluations=evaluator.real_evaluations,
+            cached_evaluations=evaluator.cached_evaluations,
+            initial_best_fitness=initial_best_fitness,
+            history=history,
+            stop_reason=snapshot.stop_reason,
+            cache_hits=evaluator.cache_hits,
+            cache_misses=evaluator.cache_misses,
+            cache_genotypes=cache_genotypes,
+            cache_fitness=cache_fitness,
         )
     
     def get_exercise_info(self) -> dict:
@@ -0,0 +1,279 @@
+"""
+Caso de uso para ejecutar el algoritmo genético con modelo de islas
+
+Cada isla es una población independiente de RunExerciseGeneticAlgorithm que
+evoluciona en un proceso distinto durante `migration_interval` generaciones
+(una época). Al final de cada época los mejores individuos migran según la
+topología y reemplazan a los peores de la isla destino.
+
+La tabla de fitness se construye una sola vez en el proceso principal y la
+caché LRU de cada isla viaja con ella de una época a la siguiente.
+"""
+
+from dataclasses import replace
+from typing import Optional, Callable
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.individual import Individual
+from domain.entities.population import Population
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.run_history import RunHistory
+from domain.entities.random_streams import RandomSource, spawn_streams
+from infrastructure.genetic_operations.fitness_evaluation import (
+    GenotypeEvaluator, DEFAULT_LOOKUP_TABLE_THRESHOLD
+)
+from application.use_cases.run_exercise_genetic_algorithm import ExerciseResult
+from application.use_cases.process_pool import get_use_case, create_executor
+from application.use_cases.termination_criteria import MAX_GENERATIONS
+
+
+TOPOLOGIES = ('ring', 'fully_connected')
+
+
+def _run_island_epoch(task: dict) -> dict:
+    """Evoluciona una isla durante una época (se ejecuta en un proceso trabajador)"""
+    use_case = get_use_case(task['exercise_key'])
+    evaluator = GenotypeEvaluator(
+        use_case.objective_function, task['parameters'], task['cache_size'],
+        task['lookup_table_threshold'], lookup_table=task['lookup_table']
+    )
+    if evaluator.cache is not None and task['cache'] is not None:
+        evaluator.cache.restore(*task['cache'])
+    snapshots = use_case.iterate(
+        task['parameters'],
+        engine=task['engine'],
+        seed=task['seed'],
+        initial_genotypes=task['genotypes'],
+        initial_fitness=task['fitness'],
+        evaluator=evaluator
+    )
+
+    generation_genotypes = []
+    generation_fitness = []
+    initial_best_fitness = None
+    for snapshot in snapshots:
+        if snapshot.generation == 0:
+            initial_best_fitness = snapshot.best_fitness
+            # El estado inicial de épocas posteriores ya se registró antes de migrar
+            if task['genotypes'] is not None:
+                continue
+        if task['record']:
+            generation_genotypes.append(snapshot.genotypes)
+            generation_fitness.append(snapshot.fitness)
+
+    cache = evaluator.cache
+    return {
+        'cache': cache.entries() + (cache.hits, cache.misses) if cache is not None else None,
+        'genotypes': snapshot.genotypes,
+        'fitness': snapshot.fitness,
+        'total_evaluations': snapshot.total_evaluations,
+        'real_evaluations': snapshot.real_evaluations,
+        'cached_evaluations': snapshot.cached_evaluations,
+        'initial_best_fitness': initial_best_fitness,
+        'generation_genotypes': generation_genotypes,
+        'generation_fitness': generation_fitness,
+    }
+
+
+class RunIslandModel:
+    """Caso de uso para ejecutar AG con varias islas en paralelo"""
+
+    def __init__(
+        self,
+        exercise_key: str = None,
+        num_islands: int = 4,
+        topology: str = 'ring',
+        migration_interval: int = 10,
+        migrants: int = 2,
+        max_workers: Optional[int] = None
+    ):
+        if num_islands < 1:
+            raise ValueError("num_islands debe ser al menos 1")
+        if topology not in TOPOLOGIES:
+            raise ValueError(
+                f"Topología desconocida: {topology} (disponibles: {', '.join(TOPOLOGIES)})"
+            )
+        if migration_interval < 1:
+            raise ValueError("migration_interval debe ser al menos 1")
+        if migrants < 0:
+            raise ValueError("migrants no puede ser negativo")
+
+        self.exercise_key = exercise_key
+        self.use_case = get_use_case(exercise_key)
+        self.num_islands = num_islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.max_workers = max_workers
+
+    def execute(
+        self,
+        custom_parameters: Optional[GAParameters] = None,
+        progress_callback: Optional[Callable] = None,
+        engine: str = "individual",
+        cache_size: Optional[int] = None,
+        lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+        recording: str = "full",
+        record_every: int = 1,
+        seed: RandomSource = None
+    ) -> ExerciseResult:
+        """
+        Ejecuta todas las islas y fusiona el resultado.
+
+        custom_parameters.population_size es el tamaño de cada isla; el
+        historial fusionado registra las islas concatenadas por generación.
+        max_workers=0 ejecuta las islas en el proceso actual.
+        Cada isla recibe un flujo aleatorio independiente derivado de `seed`
+        y cada época un subflujo de él.
+        """
+        parameters = custom_parameters or self.use_case._create_default_parameters()
+        evaluator = GenotypeEvaluator(
+            self.use_case.objective_function, parameters, cache_size, lookup_table_threshold
+        )
+        history = RunHistory(
+            parameters.num_generations, self.num_islands * parameters.population_size,
+            evaluator.num_bits, level=recording, every=record_every
+        )
+        island_streams = spawn_streams(seed, self.num_islands)
+
+        islands = [
+            {'genotypes': None, 'fitness': None, 'cache': None} for _ in range(self.num_islands)
+        ]
+        totals = {'total_evaluations': 0, 'real_evaluations': 0, 'cached_evaluations': 0}
+        initial_best_fitness = None
+        generation = 0
+
+        executor = create_executor(
+            self.max_workers if self.max_workers is not None else self.num_islands
+        )
+        try:
+            # Siempre hay una época (de longitud 0 si num_generations es 0)
+            # para evaluar la población inicial de cada isla
+            while True:
+                epoch_length = min(self.migration_interval, parameters.num_generations - generation)
+                tasks = [
+                    {
+                        'exercise_key': self.exercise_key,
+                        'parameters': replace(parameters, num_generations=epoch_length),
+                        'engine': engine,
+                        'cache_size': cache_size,
+                        'lookup_table_threshold': lookup_table_threshold,
+                        'lookup_table': evaluator.lookup_table,
+                        'cache': island['cache'],
+                        'seed': stream.spawn(1)[0],
+                        'genotypes': island['genotypes'],
+                        'fitness': island['fitness'],
+                        'record': recording != "none",
+                    }
+                    for island, stream in zip(islands, island_streams)
+                ]
+                run_epoch = executor.map if executor else map
+                epoch_results = list(run_epoch(_run_island_epoch, tasks))
+
+                # Historial fusionado (la primera época incluye la generación 0)
+                first_generation = generation if generation == 0 else generation + 1
+                for offset, (genotypes, fitness) in enumerate(zip(
+                    zip(*(r['generation_genotypes'] for r in epoch_results)),
+                    zip(*(r['generation_fitness'] for r in epoch_results))
+                )):
+                    genotypes = np.concatenate(genotypes)
+                    history.record(
+                        first_generation + offset, genotypes, np.concatenate(fitness),
+                        diversity=float(evaluator.decode(genotypes).std(ddof=1))
+                    )
+
+                for island, epoch_result in zip(islands, epoch_results):
+                    island['genotypes'] = epoch_result['genotypes']
+                    island['fitness'] = epoch_result['fitness']
+                    island['cache'] = epoch_result['cache']
+                    for key in totals:
+                        totals[key] += epoch_result[key]
+                if initial_best_fitness is None:
+                    initial_best_fitness = max(r['initial_best_fitness'] for r in epoch_results)
+                generation += epoch_length
+
+                best_fitness = max(float(island['fitness'].max()) for island in islands)
+                if progress_callback:
+                    progress_callback(generation, parameters.num_generations, best_fitness,
+                                      {'islands': self.num_islands})
+
+                if generation >= parameters.num_generations:
+                    break
+                self._migrate(islands)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return self._create_result(
+            parameters, evaluator, history, islands, totals, initial_best_fitness
+        )
+
+    def _migrate(self, islands: list):
+        """Los mejores de cada isla reemplazan a los peores de sus vecinas"""
+        count = self.migrants
+        if count == 0 or len(islands) < 2:
+            return
+
+        emigrants = []
+        for island in islands:
+            best = np.argsort(-island['fitness'], kind='stable')[:count]
+            emigrants.append((island['genotypes'][best], island['fitness'][best]))
+
+        for i, island in enumerate(islands):
+            if self.topology == 'ring':
+                sources = [(i - 1) % len(islands)]
+            else:
+                sources = [j for j in range(len(islands)) if j != i]
+
+            incoming_genotypes = np.concatenate([emigrants[j][0] for j in sources])
+            incoming_fitness = np.concatenate([emigrants[j][1] for j in sources])
+            replaced = min(len(incoming_genotypes), len(island['fitness']) - 1)
+            if replaced <= 0:
+                continue
+
+            worst = np.argsort(island['fitness'], kind='stable')[:replaced]
+            genotypes = island['genotypes'].copy()
+            fitness = island['fitness'].copy()
+            genotypes[worst] = incoming_genotypes[:replaced]
+            fitness[worst] = incoming_fitness[:replaced]
+            island['genotypes'] = genotypes
+            island['fitness'] = fitness
+
+    def _create_result(self, parameters: GAParameters, evaluator: GenotypeEvaluator,
+                       history: RunHistory, islands: list, totals: dict,
+                       initial_best_fitness: float) -> ExerciseResult:
+        """Fusiona las islas en un único ExerciseResult"""
+        num_bits = evaluator.num_bits
+        individuals = [
+            Individual(bits, num_bits, fitness)
+            for island in islands
+            for bits, fitness in zip(island['genotypes'].tolist(), island['fitness'].tolist())
+        ]
+        final_population = Population(individuals=individuals, generation=parameters.num_generations)
+        best_individual = final_population.get_best_individual()
+        best_x = best_individual.to_decimal(parameters.x_min, parameters.x_max)
+
+        use_case = self.use_case
+        return ExerciseResult(
+            best_individual=best_individual,
+            best_x=best_x,
+            best_fitness=best_individual.fitness,
+            final_population=final_population,
+            history=history,
+            parameters=parameters,
+            total_evaluations=totals['total_evaluations'],
+            improvement=best_individual.fitness - initial_best_fitness,
+            exercise_config=use_case.exercise_config,
+            original_best_value=use_case.objective_function.evaluate_original(best_x),
+            is_minimization=use_case.exercise_config.objective_type == "minimize",
+            real_evaluations=totals['real_evaluations'],
+            cached_evaluations=totals['cached_evaluations'],
+            table_evaluations=evaluator.table_evaluations,
+            cache_hits=sum(island['cache'][2] for island in islands if island['cache']),
+            cache_misses=sum(island['cache'][3] for island in islands if island['cache']),
+            lookup_table=evaluator.lookup_table,
+            stop_reason=MAX_GENERATIONS,
+            generations_run=parameters.num_generations
+        )
\ No newline at end of file
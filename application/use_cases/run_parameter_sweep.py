@@ -0,0 +1,161 @@
+"""
+Caso de uso para barrer combinaciones de parámetros en paralelo
+
+Cada combinación de la malla (producto cartesiano de los valores de cada
+parámetro) se ejecuta con las mismas semillas en un proceso trabajador y
+produce una fila de la tabla de resultados en cuanto termina.
+"""
+
+from concurrent.futures import as_completed
+from dataclasses import replace
+from itertools import product
+from typing import Optional, Iterator, List, Sequence, Dict
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.ga_parameters import GAParameters
+from infrastructure.genetic_operations.fitness_evaluation import DEFAULT_LOOKUP_TABLE_THRESHOLD
+from application.use_cases.process_pool import get_use_case, create_executor
+from application.use_cases.run_seed_batch import run_single
+
+
+# Parámetros que se pueden barrer
+PARAMETER_FIELDS = (
+    'population_size', 'num_generations', 'crossover_probability',
+    'mutation_x_probability', 'mutation_g_probability',
+)
+STRATEGY_PARAMS = (
+    'pc_threshold', 'pmi_threshold', 'pmg_threshold', 'prune_percentage', 'elitism_count',
+)
+INTEGER_PARAMETERS = ('population_size', 'num_generations', 'elitism_count')
+
+# Columnas de métricas de cada fila (después de index y los parámetros)
+RESULT_COLUMNS = (
+    'runs', 'best_value_mean', 'best_value_std', 'best_value_min', 'best_value_max',
+    'generation_of_best_mean', 'total_evaluations_mean', 'real_evaluations_mean',
+)
+
+
+def parameter_range(start: float, stop: float, step: float) -> list:
+    """Valores de start a stop (incluido) con paso step"""
+    if step <= 0:
+        raise ValueError("step debe ser mayor que 0")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return [round(start + i * step, 10) for i in range(max(count, 0))]
+
+
+def expand_grid(grid: Dict[str, Sequence]) -> List[dict]:
+    """Producto cartesiano de los valores de cada parámetro"""
+    unknown = [name for name in grid if name not in PARAMETER_FIELDS + STRATEGY_PARAMS]
+    if unknown:
+        raise ValueError(
+            f"Parámetros desconocidos: {', '.join(unknown)} "
+            f"(disponibles: {', '.join(PARAMETER_FIELDS + STRATEGY_PARAMS)})"
+        )
+    names = list(grid)
+    return [dict(zip(names, values)) for values in product(*(grid[name] for name in names))]
+
+
+def run_combination(task: dict) -> dict:
+    """Ejecuta una combinación con todas sus semillas (se ejecuta en un proceso trabajador)"""
+    combination = task['combination']
+    parameters = replace(task['parameters'], **{
+        name: value for name, value in combination.items() if name in PARAMETER_FIELDS
+    })
+    strategy_params = {
+        name: value for name, value in combination.items() if name in STRATEGY_PARAMS
+    }
+
+    runs = [
+        run_single({
+            'exercise_key': task['exercise_key'],
+            'strategy_params': strategy_params,
+            'parameters': parameters,
+            'seed': task['seed'],
+            'stream': stream,
+            'options': task['options'],
+        })
+        for stream in range(task['runs'])
+    ]
+    best_values = np.array([run['best_value'] for run in runs])
+
+    return {
+        'index': task['index'],
+        **combination,
+        'runs': len(runs),
+        'best_value_mean': float(best_values.mean()),
+        'best_value_std': float(best_values.std(ddof=1)) if len(runs) > 1 else 0.0,
+        'best_value_min': float(best_values.min()),
+        'best_value_max': float(best_values.max()),
+        'generation_of_best_mean': float(np.mean([run['generation_of_best'] for run in runs])),
+        'total_evaluations_mean': float(np.mean([run['total_evaluations'] for run in runs])),
+        'real_evaluations_mean': float(np.mean([run['real_evaluations'] for run in runs])),
+    }
+
+
+class RunParameterSweep:
+    """Caso de uso para evaluar una malla de parámetros"""
+
+    def __init__(self, exercise_key: str = None, max_workers: Optional[int] = None):
+        self.exercise_key = exercise_key
+        self.use_case = get_use_case(exercise_key)
+        self.max_workers = max_workers
+
+    def iterate(
+        self,
+        grid: Dict[str, Sequence],
+        custom_parameters: Optional[GAParameters] = None,
+        runs_per_combination: int = 1,
+        base_seed: int = 0,
+        engine: str = "individual",
+        cache_size: Optional[int] = None,
+        lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+        termination: Optional[Sequence] = None
+    ) -> Iterator[dict]:
+        """
+        Genera una fila por combinación en el orden en que terminan.
+
+        Todas las combinaciones usan los mismos flujos 0..runs_per_combination-1
+        de base_seed para que las diferencias no se deban al azar de cada corrida.
+        max_workers=0 ejecuta las combinaciones en el proceso actual.
+        """
+        if runs_per_combination < 1:
+            raise ValueError("runs_per_combination debe ser al menos 1")
+
+        parameters = custom_parameters or self.use_case._create_default_parameters()
+        options = {
+            'engine': engine,
+            'cache_size': cache_size,
+            'lookup_table_threshold': lookup_table_threshold,
+            'termination': termination,
+        }
+        tasks = [
+            {
+                'index': index,
+                'exercise_key': self.exercise_key,
+                'parameters': parameters,
+                'combination': combination,
+                'seed': base_seed,
+                'runs': runs_per_combination,
+                'options': options,
+            }
+            for index, combination in enumerate(expand_grid(grid))
+        ]
+
+        executor = create_executor(self.max_workers)
+        if executor is None:
+            for task in tasks:
+                yield run_combination(task)
+            return
+
+        try:
+            futures = [executor.submit(run_combination, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def execute(self, grid: Dict[str, Sequence], **options) -> List[dict]:
+        """Tabla completa ordenada por combinación (mismos argumentos que iterate)"""
+        return sorted(self.iterate(grid, **options), key=lambda row: row['index'])
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Caso de uso para ejecutar el algoritmo genético con varias semillas en paralelo
+y resumir los resultados con estadísticas agregadas
+"""
+
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from typing import Optional, Callable, List, Sequence
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.random_streams import spawn_stream
+from infrastructure.genetic_operations.fitness_evaluation import DEFAULT_LOOKUP_TABLE_THRESHOLD
+from application.use_cases.process_pool import get_use_case, create_executor
+
+
+# Percentiles de los resúmenes y bandas de las curvas de convergencia
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+CURVE_BAND = (10, 90)
+
+
+def run_single(task: dict) -> dict:
+    """Ejecuta una corrida y devuelve sus métricas (se ejecuta en un proceso trabajador)"""
+    use_case = get_use_case(task['exercise_key'], task.get('strategy_params'))
+    result = use_case.execute(
+        task['parameters'],
+        seed=spawn_stream(task['seed'], task['stream']),
+        recording="best",
+        **task['options']
+    )
+
+    history = result.history
+    best_fitness = history.best_fitness[:history.num_stats]
+    best_genotypes = history.best_genotypes[:history.num_stats].astype(np.int64)
+    max_decimal = (1 << history.num_bits) - 1
+    parameters = result.parameters
+    xs = parameters.x_min + (best_genotypes / max_decimal) * (parameters.x_max - parameters.x_min)
+
+    return {
+        'seed': task['seed'],
+        'stream': task['stream'],
+        'best_value': float(result.original_best_value),
+        'best_x': float(result.best_x),
+        'generation_of_best': int(np.argmax(best_fitness)),
+        'generations_run': result.generations_run,
+        'stop_reason': result.stop_reason,
+        'total_evaluations': result.total_evaluations,
+        'real_evaluations': result.real_evaluations,
+        'curve': use_case.objective_function.evaluate_original_batch(xs),
+    }
+
+
+def summarize(values: Sequence[float]) -> dict:
+    """Media, desviación, mínimo, máximo y percentiles"""
+    values = np.asarray(values, dtype=float)
+    summary = {
+        'mean': float(values.mean()),
+        'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+        'min': float(values.min()),
+        'max': float(values.max()),
+    }
+    for percentile, value in zip(SUMMARY_PERCENTILES, np.percentile(values, SUMMARY_PERCENTILES)):
+        summary[f'p{percentile}'] = float(value)
+    summary['median'] = summary['p50']
+    return summary
+
+
+@dataclass
+class SeedBatchResult:
+    """Resultado agregado de varias corridas"""
+
+    runs: List[dict]
+    summary: dict
+    curve_mean: np.ndarray
+    curve_median: np.ndarray
+    curve_low: np.ndarray
+    curve_high: np.ndarray
+    parameters: GAParameters
+    options: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Representación serializable (JSON)"""
+        return {
+            'parameters': vars(self.parameters),
+            'options': self.options,
+            'summary': self.summary,
+            'curves': {
+                'mean': self.curve_mean.tolist(),
+                'median': self.curve_median.tolist(),
+                f'p{CURVE_BAND[0]}': self.curve_low.tolist(),
+                f'p{CURVE_BAND[1]}': self.curve_high.tolist(),
+            },
+            'runs': [
+                {key: value for key, value in run.items() if key != 'curve'}
+                for run in self.runs
+            ],
+        }
+
+
+class RunSeedBatch:
+    """Caso de uso para repetir una configuración con K semillas"""
+
+    def __init__(self, exercise_key: str = None, max_workers: Optional[int] = None):
+        self.exercise_key = exercise_key
+        self.use_case = get_use_case(exercise_key)
+        self.max_workers = max_workers
+
+    def execute(
+        self,
+        custom_parameters: Optional[GAParameters] = None,
+        num_runs: int = 30,
+        base_seed: int = 0,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        engine: str = "individual",
+        cache_size: Optional[int] = None,
+        lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+        termination: Optional[Sequence] = None
+    ) -> SeedBatchResult:
+        """
+        Ejecuta `num_runs` corridas con los flujos 0..num_runs-1 de base_seed
+        (la corrida i se reproduce con execute(seed=spawn_stream(base_seed, i))).
+
+        max_workers=0 ejecuta las corridas en el proceso actual.
+        progress_callback(completadas, total) se llama al terminar cada corrida.
+        """
+        if num_runs < 1:
+            raise ValueError("num_runs debe ser al menos 1")
+
+        parameters = custom_parameters or self.use_case._create_default_parameters()
+        options = {
+            'engine': engine,
+            'cache_size': cache_size,
+            'lookup_table_threshold': lookup_table_threshold,
+            'termination': termination,
+        }
+        tasks = [
+            {
+                'exercise_key': self.exercise_key,
+                'parameters': parameters,
+                'seed': base_seed,
+                'stream': i,
+                'options': options,
+            }
+            for i in range(num_runs)
+        ]
+
+        runs = []
+        executor = create_executor(self.max_workers)
+        if executor is None:
+            for task in tasks:
+                runs.append(run_single(task))
+                if progress_callback:
+                    progress_callback(len(runs), num_runs)
+        else:
+            with executor:
+                futures = [executor.submit(run_single, task) for task in tasks]
+                for future in as_completed(futures):
+                    runs.append(future.result())
+                    if progress_callback:
+                        progress_callback(len(runs), num_runs)
+        runs.sort(key=lambda run: run['stream'])
+
+        return self._aggregate(runs, parameters, options)
+
+    def _aggregate(self, runs: List[dict], parameters: GAParameters, options: dict) -> SeedBatchResult:
+        """Resume métricas y construye las bandas de convergencia"""
+        summary = {
+            'num_runs': len(runs),
+            'best_value': summarize([run['best_value'] for run in runs]),
+            'generation_of_best': summarize([run['generation_of_best'] for run in runs]),
+            'total_evaluations': summarize([run['total_evaluations'] for run in runs]),
+            'real_evaluations': summarize([run['real_evaluations'] for run in runs]),
+        }
+
+        # Curvas de distinta longitud (parada anticipada) se extienden con su último valor
+        length = max(len(run['curve']) for run in runs)
+        curves = np.array([
+            np.pad(run['curve'], (0, length - len(run['curve'])), mode='edge')
+            for run in runs
+        ])
+
+        return SeedBatchResult(
+            runs=runs,
+            summary=summary,
+            curve_mean=curves.mean(axis=0),
+            curve_median=np.median(curves, axis=0),
+            curve_low=np.percentile(curves, CURVE_BAND[0], axis=0),
+            curve_high=np.percentile(curves, CURVE_BAND[1], axis=0),
+            parameters=parameters,
+            options={key: value for key, value in options.items() if key != 'termination'},
+        )
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Criterios de parada anticipada para la ejecución del algoritmo genético
+
+Cada criterio recibe el GenerationSnapshot de cada generación y devuelve
+True cuando la ejecución debe detenerse. `reset()` se llama al iniciar cada
+ejecución, de modo que un mismo criterio puede reutilizarse.
+"""
+
+import threading
+import time
+
+
+# Motivo de parada cuando ningún criterio se activa
+MAX_GENERATIONS = "max_generations"
+
+# Motivo de parada al cancelar con CancellationToken
+CANCELLED = "cancelled"
+
+
+class StagnationCriterion:
+    """Detiene si el mejor fitness no mejora durante `window` generaciones"""
+
+    name = "stagnation"
+
+    def __init__(self, window: int = 30, tolerance: float = 0.0):
+        if window < 1:
+            raise ValueError("window debe ser al menos 1")
+        self.window = window
+        self.tolerance = tolerance
+        self.reset()
+
+    def reset(self):
+        self._best = None
+        self._stagnant = 0
+
+    def check(self, snapshot) -> bool:
+        if self._best is None or snapshot.best_fitness > self._best + self.tolerance:
+            self._best = snapshot.best_fitness
+            self._stagnant = 0
+            return False
+        self._stagnant += 1
+        return self._stagnant >= self.window
+
+
+class MinDiversityCriterion:
+    """
+    Detiene si la diversidad cae bajo el mínimo.
+
+    metric "phenotype" usa la desviación de x; "hamming", la distancia de
+    Hamming media entre pares de genotipos (en bits).
+    """
+
+    name = "min_diversity"
+
+    # Métrica -> atributo del snapshot
+    METRICS = {'phenotype': 'diversity', 'hamming': 'hamming_diversity'}
+    DEFAULT_METRIC = "phenotype"
+
+    def __init__(self, min_diversity: float, metric: str = DEFAULT_METRIC):
+        if metric not in self.METRICS:
+            raise ValueError(
+                f"Métrica de diversidad desconocida: {metric} (disponibles: {', '.join(self.METRICS)})"
+            )
+        self.min_diversity = min_diversity
+        self.metric = metric
+        self._attribute = self.METRICS[metric]
+
+    def reset(self):
+        pass
+
+    def check(self, snapshot) -> bool:
+        return getattr(snapshot, self._attribute) < self.min_diversity
+
+
+class TargetValueCriterion:
+    """Detiene al alcanzar un valor objetivo de la función original"""
+
+    name = "target_value"
+
+    def __init__(self, target: float, objective_type: str = "minimize"):
+        self.target = target
+        self.objective_type = objective_type
+
+    def reset(self):
+        pass
+
+    def check(self, snapshot) -> bool:
+        if self.objective_type == "minimize":
+            return snapshot.best_value <= self.target
+        return snapshot.best_value >= self.target
+
+
+class MaxEvaluationsCriterion:
+    """Detiene al alcanzar un número máximo de evaluaciones"""
+
+    name = "max_evaluations"
+
+    def __init__(self, max_evaluations: int):
+        self.max_evaluations = max_evaluations
+
+    def reset(self):
+        pass
+
+    def check(self, snapshot) -> bool:
+        return snapshot.total_evaluations >= self.max_evaluations
+
+
+class TimeBudgetCriterion:
+    """Detiene al agotar un presupuesto de tiempo real (segundos)"""
+
+    name = "time_budget"
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.reset()
+
+    def reset(self):
+        self._start = time.perf_counter()
+
+    def check(self, snapshot) -> bool:
+        return time.perf_counter() - self._start >= self.seconds
+
+
+class CancellationToken:
+    """
+    Permite detener una ejecución desde otro hilo.
+
+    Se comporta como un criterio de parada: la ejecución termina al final de
+    la generación en curso con stop_reason "cancelled". reset() no borra una
+    cancelación pedida antes de empezar.
+    """
+
+    name = CANCELLED
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Pide detener la ejecución"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Indica si se pidió la cancelación"""
+        return self._event.is_set()
+
+    def reset(self):
+        pass
+
+    def check(self, snapshot) -> bool:
+        return self._event.is_set()
\ No newline at end of file
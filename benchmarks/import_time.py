@@ -0,0 +1,115 @@
+"""
+Informe de tiempo de importación (estilo -X importtime) de los puntos de entrada
+
+Cada módulo se importa en un proceso nuevo con `python -X importtime` para
+medir un arranque en frío; el informe JSON incluye el tiempo acumulado del
+módulo, el tiempo total del proceso y los módulos más costosos.
+
+Uso:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --modules application.cli --top 20 -o imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+# Puntos de entrada medidos por defecto
+DEFAULT_MODULES = (
+    'presentation.views.main_window_simplified',
+    'presentation.controllers.exercise_controller',
+    'application.cli',
+    'application.use_cases.run_exercise_genetic_algorithm',
+    'presentation.visualization.graph_factory',
+    'presentation.utils.video_generator',
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """Líneas 'import time: propio | acumulado | módulo' como diccionarios (µs)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # encabezado
+        name = fields[2].rstrip()
+        entries.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip())) // 2,
+            'self_us': int(fields[0]),
+            'cumulative_us': int(fields[1]),
+        })
+    return entries
+
+
+def measure_module(module: str, top: int = 10) -> dict:
+    """Importa `module` en un proceso nuevo y resume sus tiempos"""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+
+    entries = parse_importtime(process.stderr)
+    own = next((entry for entry in entries if entry['module'] == module), None)
+    heaviest = sorted(
+        (entry for entry in entries if entry['depth'] <= 1),
+        key=lambda entry: entry['cumulative_us'], reverse=True
+    )[:top]
+
+    report = {
+        'module': module,
+        'ok': process.returncode == 0,
+        'process_seconds': wall,
+        'total_import_us': sum(entry['cumulative_us'] for entry in entries if entry['depth'] == 0),
+        'module_cumulative_us': own['cumulative_us'] if own else None,
+        'num_modules': len(entries),
+        'heaviest': [
+            {'module': entry['module'], 'cumulative_us': entry['cumulative_us']}
+            for entry in heaviest
+        ],
+    }
+    if process.returncode != 0:
+        report['error'] = process.stderr.strip().splitlines()[-1]
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time',
+                                     description="Tiempo de importación de los puntos de entrada")
+    parser.add_argument('--modules', default=None,
+                        help="módulos separados por comas (por defecto los puntos de entrada)")
+    parser.add_argument('--top', type=int, default=10, help="módulos más costosos a listar")
+    parser.add_argument('--output', '-o', default=None, help="archivo JSON del informe")
+    args = parser.parse_args(argv)
+
+    modules = args.modules.split(',') if args.modules else list(DEFAULT_MODULES)
+    reports = []
+    for module in modules:
+        report = measure_module(module, args.top)
+        reports.append(report)
+        status = f"{report['total_import_us'] / 1000:>8.1f} ms" if report['ok'] else "ERROR"
+        print(f"{module:<55} {status}  ({report['process_seconds']:.2f} s proceso)",
+              file=sys.stderr, flush=True)
+
+    text = json.dumps({'python': sys.version.split()[0], 'imports': reports}, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
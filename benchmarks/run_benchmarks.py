@@ -0,0 +1,306 @@
+"""
+Benchmarks de las rutas críticas del algoritmo genético
+
+Cada benchmark se mide sobre una matriz de tamaños de población y longitudes
+de genoma; el resultado es JSON con operaciones por segundo (individuos
+procesados por segundo) y memoria pico (tracemalloc) de una llamada.
+
+Uso:
+    python -m benchmarks.run_benchmarks --output baseline.json
+    python -m benchmarks.run_benchmarks --sizes 25,1000 --only crossover,mutation
+    python -m benchmarks.run_benchmarks --compare baseline.json --tolerance 0.10
+
+El tiempo de importación de los puntos de entrada se mide con benchmarks.import_time.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.ga_parameters import GAParameters
+from domain.entities.population import Population, hamming_diversity
+from domain.entities.random_streams import create_rng
+from infrastructure.genetic_operations.crossover_strategies import TwoPointCrossover
+from infrastructure.genetic_operations.exercise_specific_strategies import (
+    ThresholdSwapMutation, PruneWorstSelection
+)
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+
+
+DEFAULT_SIZES = (25, 100, 1000, 10000, 100000)
+DEFAULT_BITS = (10, 20, 40)
+
+# Generaciones de los benchmarks de ejecución completa
+RUN_GENERATIONS = 5
+
+# Intervalo de búsqueda de los benchmarks de individuos
+X_MIN, X_MAX = 6.30, 15.30
+
+
+def _random_population(size: int, num_bits: int) -> Population:
+    """Población aleatoria reproducible con fitness aleatorio"""
+    rng = create_rng(0)
+    population = Population.create_random(size, num_bits, rng=rng)
+    population.update_fitness(rng.random(size))
+    return population
+
+
+def bench_to_decimal(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """Individual.to_decimal sobre toda la población"""
+    individuals = _random_population(size, num_bits).individuals
+
+    def run():
+        for individual in individuals:
+            individual.to_decimal(X_MIN, X_MAX)
+    return run, size
+
+
+def bench_best_individual(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """Population.get_best_individual sin caché (se invalida en cada llamada)"""
+    population = _random_population(size, num_bits)
+
+    def run():
+        population.invalidate()
+        population.get_best_individual()
+    return run, size
+
+
+def bench_diversity(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """Population.get_diversity"""
+    population = _random_population(size, num_bits)
+    return lambda: population.get_diversity(X_MIN, X_MAX), size
+
+
+def bench_hamming_diversity(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """hamming_diversity sobre los genotipos enteros (la medida registrada por generación)"""
+    genotypes = create_rng(0).integers(0, 2 ** num_bits, size=size, dtype=np.uint64)
+    return lambda: hamming_diversity(genotypes, num_bits), size
+
+
+def bench_crossover(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """TwoPointCrossover.crossover sobre parejas consecutivas (siempre cruza)"""
+    individuals = _random_population(size, num_bits).individuals
+    crossover = TwoPointCrossover()
+    rng = create_rng(1)
+
+    def run():
+        for i in range(0, size - 1, 2):
+            crossover.crossover(individuals[i], individuals[i + 1], 1.0, rng=rng)
+    return run, size
+
+
+def bench_crossover_batch(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """TwoPointCrossover.crossover_batch sobre parejas consecutivas (siempre cruza)"""
+    genes = create_rng(0).integers(0, 2, size=(size, num_bits), dtype=np.uint8)
+    pairs = np.arange(size - size % 2).reshape(-1, 2)
+    crossover = TwoPointCrossover()
+    rng = create_rng(1)
+    return lambda: crossover.crossover_batch(genes, pairs, 1.0, rng=rng), size
+
+
+def bench_mutation(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """ThresholdSwapMutation.mutate con los umbrales por defecto"""
+    individuals = _random_population(size, num_bits).individuals
+    mutation = ThresholdSwapMutation()
+    rng = create_rng(1)
+
+    def run():
+        for individual in individuals:
+            mutation.mutate(individual, 0.0, rng=rng)
+    return run, size
+
+
+def bench_mutation_batch(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """ThresholdSwapMutation.mutate_batch sobre toda la matriz de bits"""
+    genes = create_rng(0).integers(0, 2, size=(size, num_bits), dtype=np.uint8)
+    mutation = ThresholdSwapMutation()
+    rng = create_rng(1)
+    return lambda: mutation.mutate_batch(genes, rng=rng), size
+
+
+def bench_prune_worst(size: int, num_bits: int) -> Tuple[Callable, int]:
+    """PruneWorstSelection.select con truncamiento"""
+    population = _random_population(size, num_bits)
+    selection = PruneWorstSelection()
+    target_size = max(1, int(size * 0.8))
+    return lambda: selection.select(population, target_size), size
+
+
+def _bench_run(engine: str) -> Callable:
+    """Ejecución completa de RUN_GENERATIONS generaciones con el motor dado"""
+    def bench(size: int, num_bits: int) -> Tuple[Callable, int]:
+        use_case = RunExerciseGeneticAlgorithm()
+        parameters = GAParameters(
+            x_min=0.0, x_max=float(2 ** num_bits - 1), delta_x=1.0,
+            population_size=size, num_generations=RUN_GENERATIONS,
+            crossover_probability=0.75, mutation_x_probability=0.2,
+            mutation_g_probability=0.2
+        )
+        return lambda: use_case.execute(parameters, engine=engine, seed=0), size * RUN_GENERATIONS
+    bench.__doc__ = f"RunExerciseGeneticAlgorithm.execute, {RUN_GENERATIONS} generaciones, motor {engine}"
+    return bench
+
+
+BENCHMARKS: Dict[str, Callable[[int, int], Tuple[Callable, int]]] = {
+    'to_decimal': bench_to_decimal,
+    'best_individual': bench_best_individual,
+    'diversity': bench_diversity,
+    'hamming_diversity': bench_hamming_diversity,
+    'crossover': bench_crossover,
+    'crossover_batch': bench_crossover_batch,
+    'mutation': bench_mutation,
+    'mutation_batch': bench_mutation_batch,
+    'prune_worst': bench_prune_worst,
+    'run_individual': _bench_run('individual'),
+    'run_matrix': _bench_run('matrix'),
+}
+
+
+def measure(setup: Callable[[int, int], Tuple[Callable, int]], size: int, num_bits: int,
+            min_time: float = 0.2) -> dict:
+    """Repite la operación hasta acumular min_time segundos y mide una llamada con tracemalloc"""
+    run, items = setup(size, num_bits)
+    run()  # calentamiento
+
+    repeats = 0
+    elapsed = 0.0
+    while elapsed < min_time:
+        start = time.perf_counter()
+        run()
+        elapsed += time.perf_counter() - start
+        repeats += 1
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'repeats': repeats,
+        'seconds_per_call': elapsed / repeats,
+        'ops_per_sec': items * repeats / elapsed,
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_benchmarks(names: List[str], sizes: List[int], bits: List[int],
+                   min_time: float = 0.2, log: Optional[Callable[[str], None]] = None) -> dict:
+    """Ejecuta la matriz de benchmarks y devuelve el informe"""
+    results = []
+    for name in names:
+        for size in sizes:
+            for num_bits in bits:
+                result = {'benchmark': name, 'population_size': size, 'num_bits': num_bits}
+                result.update(measure(BENCHMARKS[name], size, num_bits, min_time))
+                results.append(result)
+                if log:
+                    log(_format_result(result))
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'min_time': min_time,
+        },
+        'results': results,
+    }
+
+
+def _key(result: dict) -> tuple:
+    return result['benchmark'], result['population_size'], result['num_bits']
+
+
+def _format_result(result: dict) -> str:
+    return (f"{result['benchmark']:<16} n={result['population_size']:<7} "
+            f"bits={result['num_bits']:<3} {result['ops_per_sec']:>14,.0f} ops/s "
+            f"{result['peak_memory_bytes'] / 1024:>10,.1f} KiB")
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.10) -> List[dict]:
+    """Cociente ops/s actual/base por caso; regresión si cae más que `tolerance`"""
+    baseline_results = {_key(result): result for result in baseline['results']}
+    comparisons = []
+    for result in report['results']:
+        base = baseline_results.get(_key(result))
+        if base is None:
+            continue
+        speedup = result['ops_per_sec'] / base['ops_per_sec']
+        comparisons.append({
+            'benchmark': result['benchmark'],
+            'population_size': result['population_size'],
+            'num_bits': result['num_bits'],
+            'speedup': speedup,
+            'memory_ratio': result['peak_memory_bytes'] / max(base['peak_memory_bytes'], 1),
+            'regression': speedup < 1.0 - tolerance,
+        })
+    return comparisons
+
+
+def _log(line: str):
+    print(line, file=sys.stderr, flush=True)
+
+
+def _parse_list(text: str) -> List[int]:
+    return [int(value) for value in text.split(',')]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada; devuelve 1 si la comparación encuentra regresiones"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run_benchmarks',
+                                     description="Benchmarks de las rutas críticas")
+    parser.add_argument('--only', default=None,
+                        help=f"benchmarks separados por comas ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--sizes', type=_parse_list, default=list(DEFAULT_SIZES),
+                        help="tamaños de población separados por comas")
+    parser.add_argument('--bits', type=_parse_list, default=list(DEFAULT_BITS),
+                        help="longitudes de genoma separadas por comas")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="segundos mínimos de medición por caso")
+    parser.add_argument('--output', '-o', default=None, help="archivo JSON del informe")
+    parser.add_argument('--compare', default=None, help="informe JSON base para comparar")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="caída relativa de ops/s tolerada antes de marcar regresión")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Benchmarks desconocidos: {', '.join(unknown)}")
+
+    report = run_benchmarks(names, args.sizes, args.bits, args.min_time, _log)
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            comparisons = compare(report, json.load(file), args.tolerance)
+        report['comparison'] = comparisons
+        for item in comparisons:
+            flag = "REGRESIÓN" if item['regression'] else ""
+            _log(f"{item['benchmark']:<16} n={item['population_size']:<7} "
+                f"bits={item['num_bits']:<3} x{item['speedup']:.2f} {flag}")
+        if any(item['regression'] for item in comparisons):
+            exit_code = 1
+
+    text = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Configuración de pytest: la raíz del proyecto queda en sys.path para que las
+pruebas usen las mismas importaciones absolutas que la aplicación.
+"""
\ No newline at end of file
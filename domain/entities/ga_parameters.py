@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-import numpy as np
+import math
 
 
 @dataclass
@@ -29,10 +29,10 @@ class GAParameters:
             return 5
         elif self.x_min >= 0 and self.x_max == int(self.x_max) and self.delta_x == 1.0:
             range_size = int(self.x_max - self.x_min) + 1
-            return int(np.ceil(np.log2(range_size)))
+            return int(math.ceil(math.log2(range_size)))
         else:
             num_divisions = int((self.x_max - self.x_min) / self.delta_x)
-            return int(np.ceil(np.log2(num_divisions + 1)))
+            return int(math.ceil(math.log2(num_divisions + 1)))
     
     def calculate_max_decimal(self) -> int:
         """Valor decimal máximo"""
@@ -1,42 +1,90 @@
-from typing import List
-from dataclasses import dataclass
-import random
+from typing import List, Optional
+import numpy as np
+
+from .random_streams import resolve_rng
 
 
-@dataclass
 class Individual:
-    """Individuo del algoritmo genético"""
-    
-    genes: List[int]
-    fitness: float = 0.0
-    
-    def __post_init__(self):
-        if not all(gene in [0, 1] for gene in self.genes):
+    """
+    Individuo del algoritmo genético.
+
+    El genoma se guarda empaquetado en un entero (`bits`); el gen 0 es el
+    bit más significativo, igual que en la representación como lista.
+    """
+
+    __slots__ = ('bits', 'num_bits', 'fitness')
+
+    def __init__(self, bits: int, num_bits: int, fitness: float = 0.0):
+        if num_bits < 0:
+            raise ValueError("num_bits no puede ser negativo")
+        if bits < 0 or bits >> num_bits:
             raise ValueError("Los genes deben ser 0 o 1")
-    
+        self.bits = bits
+        self.num_bits = num_bits
+        self.fitness = fitness
+
     @classmethod
-    def create_random(cls, num_bits: int) -> 'Individual':
+    def from_genes(cls, genes: List[int], fitness: float = 0.0) -> 'Individual':
+        """Crea individuo desde lista de genes"""
+        bits = 0
+        for gene in genes:
+            if gene not in (0, 1):
+                raise ValueError("Los genes deben ser 0 o 1")
+            bits = bits * 2 + gene
+        return cls(bits=bits, num_bits=len(genes), fitness=fitness)
+
+    @classmethod
+    def create_random(cls, num_bits: int,
+                      rng: Optional[np.random.Generator] = None) -> 'Individual':
         """Crea individuo aleatorio"""
-        genes = [random.randint(0, 1) for _ in range(num_bits)]
-        return cls(genes=genes)
-    
+        num_bytes = (num_bits + 7) // 8
+        bits = int.from_bytes(resolve_rng(rng).bytes(num_bytes), 'big') >> (8 * num_bytes - num_bits)
+        return cls(bits=bits, num_bits=num_bits)
+
+    @property
+    def genes(self) -> List[int]:
+        """Genes como lista (se reconstruye en cada acceso)"""
+        return [int(bit) for bit in self.get_binary_string()]
+
     def to_decimal(self, x_min: float, x_max: float) -> float:
         """Convierte a valor decimal"""
-        decimal = 0
-        for bit in self.genes:
-            decimal = decimal * 2 + bit
-        
-        max_decimal = 2**len(self.genes) - 1
+        max_decimal = (1 << self.num_bits) - 1
         if max_decimal == 0:
             return x_min
-        
-        x = x_min + (decimal / max_decimal) * (x_max - x_min)
+
+        x = x_min + (self.bits / max_decimal) * (x_max - x_min)
         return x
-    
+
+    def with_bits(self, bits: int) -> 'Individual':
+        """
+        Individuo con el genoma `bits` (copia en escritura).
+
+        Si el genoma no cambia se devuelve el mismo objeto y conserva su
+        fitness; si cambia se crea uno nuevo sin evaluar.
+        """
+        if bits == self.bits:
+            return self
+        return Individual(bits, self.num_bits)
+
     def copy(self) -> 'Individual':
-        """Crea copia"""
-        return Individual(genes=self.genes.copy(), fitness=self.fitness)
-    
+        """Crea copia (el genoma es inmutable y se comparte)"""
+        return Individual(self.bits, self.num_bits, self.fitness)
+
     def get_binary_string(self) -> str:
         """Representación binaria como string"""
-        return ''.join(map(str, self.genes))
\ No newline at end of file
+        if self.num_bits == 0:
+            return ''
+        return format(self.bits, f'0{self.num_bits}b')
+
+    def __len__(self) -> int:
+        return self.num_bits
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Individual):
+            return NotImplemented
+        return (self.bits, self.num_bits, self.fitness) == (other.bits, other.num_bits, other.fitness)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Individual(genes={self.get_binary_string()!r}, fitness={self.fitness!r})"
\ No newline at end of file
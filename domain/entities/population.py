@@ -1,41 +1,96 @@
-from typing import List
-from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from dataclasses import dataclass, field
+import numpy as np
 from .individual import Individual
-import statistics
+
+
+def hamming_diversity(genotypes: np.ndarray, num_bits: int) -> float:
+    """
+    Distancia de Hamming media entre todos los pares de genotipos enteros.
+    
+    Se calcula con los conteos de unos por bit en O(n·bits): un bit con c
+    unos entre n individuos separa c·(n - c) pares, de modo que la media es
+    la suma de 2·c·(n - c) / (n·(n - 1)) sobre los bits. Solo se desempacan
+    los bytes que contienen los num_bits bits bajos.
+    """
+    n = len(genotypes)
+    if n < 2 or num_bits == 0:
+        return 0.0
+    
+    num_bytes = (num_bits + 7) // 8
+    packed = np.ascontiguousarray(genotypes, dtype='>u8').view(np.uint8).reshape(n, 8)
+    ones = np.unpackbits(packed[:, 8 - num_bytes:], axis=1).sum(axis=0, dtype=np.int64)
+    return float((2 * ones * (n - ones)).sum() / (n * (n - 1)))
 
 
 @dataclass
 class Population:
-    """Población de individuos"""
+    """
+    Población de individuos.
+    
+    El índice del mejor individuo se guarda en caché; update_fitness() lo
+    mantiene y quien modifique `individuals` o el fitness directamente debe
+    llamar a invalidate().
+    """
     
     individuals: List[Individual]
     generation: int = 0
+    _best_index: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.individuals:
             raise ValueError("La población no puede estar vacía")
     
     @classmethod
-    def create_random(cls, size: int, num_bits: int, generation: int = 0) -> 'Population':
+    def create_random(cls, size: int, num_bits: int, generation: int = 0,
+                      rng: Optional[np.random.Generator] = None) -> 'Population':
         """Crea población aleatoria"""
-        individuals = [Individual.create_random(num_bits) for _ in range(size)]
+        individuals = [Individual.create_random(num_bits, rng) for _ in range(size)]
         return cls(individuals=individuals, generation=generation)
     
+    def get_best_index(self) -> int:
+        """Índice del mejor individuo (el primero en caso de empate)"""
+        if self._best_index is None:
+            individuals = self.individuals
+            self._best_index = max(range(len(individuals)), key=lambda i: individuals[i].fitness)
+        return self._best_index
+    
     def get_best_individual(self) -> Individual:
         """Mejor individuo"""
-        return max(self.individuals, key=lambda ind: ind.fitness)
+        return self.individuals[self.get_best_index()]
+    
+    def update_fitness(self, fitness_values: Sequence[float]):
+        """Asigna el fitness de cada individuo y actualiza el mejor en caché"""
+        fitness_values = np.asarray(fitness_values, dtype=float)
+        if len(fitness_values) != len(self.individuals):
+            raise ValueError(
+                f"Se recibieron {len(fitness_values)} valores de fitness "
+                f"para {len(self.individuals)} individuos"
+            )
+        for individual, value in zip(self.individuals, fitness_values.tolist()):
+            individual.fitness = value
+        self._best_index = int(np.argmax(fitness_values))
+    
+    def invalidate(self):
+        """Descarta el mejor en caché tras cambios externos"""
+        self._best_index = None
     
     def get_best_fitness(self) -> float:
         """Mejor fitness"""
         return self.get_best_individual().fitness
     
     def get_diversity(self, x_min: float, x_max: float) -> float:
-        """Diversidad de la población"""
+        """Diversidad fenotípica: desviación estándar muestral de x"""
         if len(self.individuals) < 2:
             return 0.0
         
         decimal_values = [ind.to_decimal(x_min, x_max) for ind in self.individuals]
-        return statistics.stdev(decimal_values)
+        return float(np.std(decimal_values, ddof=1))
+    
+    def get_hamming_diversity(self) -> float:
+        """Diversidad genotípica: distancia de Hamming media entre pares"""
+        genotypes = np.array([ind.bits for ind in self.individuals], dtype=np.uint64)
+        return hamming_diversity(genotypes, self.individuals[0].num_bits)
     
     def size(self) -> int:
         """Tamaño de población"""
@@ -44,7 +99,9 @@ class Population:
     def copy(self) -> 'Population':
         """Crea copia"""
         copied_individuals = [ind.copy() for ind in self.individuals]
-        return Population(individuals=copied_individuals, generation=self.generation)
+        population = Population(individuals=copied_individuals, generation=self.generation)
+        population._best_index = self._best_index
+        return population
     
     def __len__(self) -> int:
         return len(self.individuals)
@@ -0,0 +1,76 @@
+"""
+Fuentes de aleatoriedad inyectables (numpy.random.Generator)
+
+Una semilla maestra se divide con SeedSequence en flujos estadísticamente
+independientes: el flujo `index` de una semilla es el mismo que produce
+SeedSequence(seed).spawn(...)[index], así cada corrida, isla o proceso
+puede reproducirse por separado.
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+# Semilla, SeedSequence o Generator aceptados por create_rng
+RandomSource = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+# Generador compartido cuando no se inyecta ninguno
+_DEFAULT_RNG = np.random.default_rng()
+
+
+def create_rng(seed: RandomSource = None) -> np.random.Generator:
+    """Generator a partir de una semilla, SeedSequence o Generator (se reutiliza)"""
+    return np.random.default_rng(seed)
+
+
+def resolve_rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """El generador dado o el compartido por defecto"""
+    return _DEFAULT_RNG if rng is None else rng
+
+
+def get_rng_state(rng: np.random.Generator) -> dict:
+    """
+    Estado del generador serializable en JSON.
+    
+    Incluye el nombre del generador de bits (clave 'bit_generator'); los
+    arreglos de estado (MT19937, Philox, SFC64...) se guardan como listas.
+    """
+    return _to_builtin(rng.bit_generator.state)
+
+
+def rng_from_state(state: dict) -> np.random.Generator:
+    """Generator con el generador de bits y el estado guardados por get_rng_state"""
+    bit_generator_class = getattr(np.random, state['bit_generator'], None)
+    if not (isinstance(bit_generator_class, type)
+            and issubclass(bit_generator_class, np.random.BitGenerator)):
+        raise ValueError(f"Generador de bits desconocido: {state['bit_generator']}")
+    
+    bit_generator = bit_generator_class()
+    bit_generator.state = state
+    return np.random.Generator(bit_generator)
+
+
+def _to_builtin(value):
+    """Copia de un estado con los arreglos de numpy convertidos en listas"""
+    if isinstance(value, dict):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+def spawn_stream(seed: Optional[int], index: int) -> np.random.SeedSequence:
+    """Flujo `index` de la semilla maestra"""
+    if seed is None:
+        return np.random.SeedSequence().spawn(1)[0]
+    return np.random.SeedSequence(seed, spawn_key=(index,))
+
+
+def spawn_streams(seed: RandomSource, count: int) -> List[np.random.SeedSequence]:
+    """`count` flujos independientes de la semilla maestra"""
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq.spawn(count)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(count)
\ No newline at end of file
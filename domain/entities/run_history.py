@@ -0,0 +1,208 @@
+from typing import Callable, Optional, Sequence
+import numpy as np
+
+from .individual import Individual
+from .population import Population, hamming_diversity
+
+
+# Niveles de registro del historial, de menor a mayor detalle
+RECORDING_LEVELS = ('none', 'best', 'summary', 'every_k', 'full')
+
+
+def genotype_dtype(num_bits: int) -> np.dtype:
+    """Entero sin signo más pequeño que contiene num_bits"""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if num_bits <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    raise ValueError(f"No se pueden almacenar genotipos de {num_bits} bits")
+
+
+class LazyRows(Sequence):
+    """Secuencia de solo lectura que construye cada elemento al accederlo"""
+
+    def __init__(self, length: int, factory: Callable[[int], object]):
+        self._length = length
+        self._factory = factory
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de historial fuera de rango")
+        return self._factory(index)
+
+
+class RunHistory:
+    """
+    Historial columnar de una ejecución.
+
+    Guarda genotipos enteros y fitness en arreglos preasignados en lugar de
+    copias de Population; las poblaciones se reconstruyen solo cuando se piden.
+
+    Niveles de registro (`level`):
+    - none: nada por generación (solo queda la población final del resultado)
+    - best: mejor fitness y mejor genotipo por generación
+    - summary: lo anterior más media, peor y desviación del fitness y la
+      diversidad fenotípica (desviación de x) y genotípica (Hamming media)
+    - every_k: summary más la población completa cada `every` generaciones
+      (la inicial y la final siempre se registran)
+    - full: summary más la población completa en cada generación
+    """
+
+    def __init__(self, num_generations: int, population_size: int, num_bits: int,
+                 level: str = 'full', every: int = 1):
+        if level not in RECORDING_LEVELS:
+            raise ValueError(
+                f"Nivel de registro desconocido: {level} (disponibles: {', '.join(RECORDING_LEVELS)})"
+            )
+        if every < 1:
+            raise ValueError("every debe ser al menos 1")
+
+        self.level = level
+        self.every = every if level == 'every_k' else 1
+        self.num_generations = num_generations
+        self.num_bits = num_bits
+        self.population_size = population_size
+
+        rows = num_generations + 1 if level != 'none' else 0
+        stat_rows = rows if level not in ('none', 'best') else 0
+        if level == 'full':
+            population_rows = rows
+        elif level == 'every_k':
+            population_rows = num_generations // self.every + 1
+            population_rows += 1 if num_generations % self.every else 0
+        else:
+            population_rows = 0
+
+        dtype = genotype_dtype(num_bits)
+        self.best_fitness = np.zeros(rows, dtype=float)
+        self.best_genotypes = np.zeros(rows, dtype=dtype)
+        self.mean_fitness = np.zeros(stat_rows, dtype=float)
+        self.worst_fitness = np.zeros(stat_rows, dtype=float)
+        self.std_fitness = np.zeros(stat_rows, dtype=float)
+        self.diversity = np.zeros(stat_rows, dtype=float)
+        self.hamming_diversity = np.zeros(stat_rows, dtype=float)
+        self.generations = np.zeros(population_rows, dtype=np.int64)
+        self.genotypes = np.zeros((population_rows, population_size), dtype=dtype)
+        self.fitness = np.zeros((population_rows, population_size), dtype=float)
+
+        self.num_stats = 0
+        self.num_recorded = 0
+
+    def record(self, generation: int, genotypes: np.ndarray, fitness: np.ndarray,
+               final: bool = False, diversity: float = 0.0,
+               hamming: Optional[float] = None):
+        """
+        Registra el estado de una generación según el nivel (final: última de la ejecución).
+        
+        diversity es la diversidad fenotípica ya calculada; la de Hamming se
+        calcula aquí si no se da.
+        """
+        if self.level == 'none':
+            return
+
+        row = self.num_stats
+        best = int(np.argmax(fitness))
+        self.best_fitness[row] = fitness[best]
+        self.best_genotypes[row] = genotypes[best]
+        if len(self.mean_fitness):
+            self.mean_fitness[row] = fitness.mean()
+            self.worst_fitness[row] = fitness.min()
+            self.std_fitness[row] = fitness.std()
+            self.diversity[row] = diversity
+            self.hamming_diversity[row] = hamming_diversity(genotypes, self.num_bits) if hamming is None else hamming
+        self.num_stats += 1
+
+        if len(self.generations) and (
+            final or generation % self.every == 0 or generation == self.num_generations
+        ):
+            snapshot = self.num_recorded
+            self.generations[snapshot] = generation
+            self.genotypes[snapshot] = genotypes
+            self.fitness[snapshot] = fitness
+            self.num_recorded += 1
+
+    def records_summary(self) -> bool:
+        """Indica si el nivel registra estadísticas y diversidades por generación"""
+        return len(self.mean_fitness) > 0
+
+    def has_best(self) -> bool:
+        """Indica si se registró el mejor fitness por generación"""
+        return self.num_stats > 0
+
+    def has_summary(self) -> bool:
+        """Indica si se registraron estadísticas por generación"""
+        return len(self.mean_fitness) > 0 and self.num_stats > 0
+
+    def has_populations(self) -> bool:
+        """Indica si se registraron poblaciones completas"""
+        return self.num_recorded > 0
+
+    def get_population(self, index: int) -> Population:
+        """Población registrada en la posición `index`"""
+        individuals = [
+            Individual(bits, self.num_bits, fitness)
+            for bits, fitness in zip(self.genotypes[index].tolist(), self.fitness[index].tolist())
+        ]
+        return Population(individuals=individuals, generation=int(self.generations[index]))
+
+    def population_view(self) -> LazyRows:
+        """Poblaciones registradas (perezosas)"""
+        return LazyRows(self.num_recorded, self.get_population)
+
+    def fitness_view(self) -> LazyRows:
+        """Listas de fitness por población registrada (perezosas)"""
+        return LazyRows(self.num_recorded, lambda index: self.fitness[index].tolist())
+
+    def recorded_generations(self) -> list:
+        """Números de generación de las poblaciones registradas"""
+        return self.generations[:self.num_recorded].tolist()
+
+    def best_fitness_list(self) -> list:
+        """Mejor fitness por generación (vacío con nivel none)"""
+        return self.best_fitness[:self.num_stats].tolist()
+
+    def to_arrays(self) -> dict:
+        """Estado completo como arreglos (p. ej. para np.savez)"""
+        return {
+            'level': np.array(self.level),
+            'every': np.array(self.every),
+            'shape': np.array([self.num_generations, self.population_size, self.num_bits]),
+            'counts': np.array([self.num_stats, self.num_recorded]),
+            'best_fitness': self.best_fitness,
+            'best_genotypes': self.best_genotypes,
+            'mean_fitness': self.mean_fitness,
+            'worst_fitness': self.worst_fitness,
+            'std_fitness': self.std_fitness,
+            'diversity': self.diversity,
+            'hamming_diversity': self.hamming_diversity,
+            'generations': self.generations,
+            'genotypes': self.genotypes,
+            'fitness': self.fitness,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays) -> 'RunHistory':
+        """Historial a partir de to_arrays()"""
+        num_generations, population_size, num_bits = (int(value) for value in arrays['shape'])
+        history = cls(num_generations, population_size, num_bits,
+                      level=str(arrays['level']), every=int(arrays['every']))
+        for name in ('best_fitness', 'best_genotypes', 'mean_fitness', 'worst_fitness',
+                     'std_fitness', 'diversity', 'hamming_diversity', 'generations',
+                     'genotypes', 'fitness'):
+            getattr(history, name)[...] = arrays[name]
+        history.num_stats, history.num_recorded = (int(value) for value in arrays['counts'])
+        return history
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arreglos"""
+        arrays = (self.best_fitness, self.best_genotypes, self.mean_fitness,
+                  self.worst_fitness, self.std_fitness, self.diversity,
+                  self.hamming_diversity, self.generations,
+                  self.genotypes, self.fitness)
+        return sum(array.nbytes for array in arrays)
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+import numpy as np
+
 
 class ObjectiveFunction(Protocol):
     """Interface para funciones objetivo"""
@@ -8,6 +10,18 @@ class ObjectiveFunction(Protocol):
         """Evalúa la función objetivo en x"""
         ...
     
+    def evaluate_original(self, x: float) -> float:
+        """Evalúa la función original (sin ajuste de signo) en x"""
+        ...
+    
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """Evalúa la función objetivo sobre un arreglo de x"""
+        ...
+    
+    def evaluate_original_batch(self, xs: np.ndarray) -> np.ndarray:
+        """Evalúa la función original sobre un arreglo de x"""
+        ...
+    
     def get_name(self) -> str:
         """Nombre de la función"""
         ...
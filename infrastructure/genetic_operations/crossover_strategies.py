@@ -2,34 +2,85 @@
 Estrategias de cruzamiento
 """
 
-import random
-from typing import Tuple
+from typing import Tuple, Optional
+
+import numpy as np
 
 # IMPORTACIÓN ABSOLUTA (SIN ... ni ..)
 from domain.entities.individual import Individual
+from domain.entities.random_streams import resolve_rng
 
 
 class TwoPointCrossover:
     """Cruzamiento de dos puntos"""
     
-    def crossover(self, parent1: Individual, parent2: Individual, probability: float) -> Tuple[Individual, Individual]:
-        """Realiza cruzamiento de dos puntos"""
-        if random.random() >= probability or len(parent1.genes) < 3:
-            return parent1.copy(), parent2.copy()
+    def crossover(self, parent1: Individual, parent2: Individual, probability: float,
+                  rng: Optional[np.random.Generator] = None) -> Tuple[Individual, Individual]:
+        """
+        Realiza cruzamiento de dos puntos.
+        
+        Un hijo idéntico a su padre es el mismo objeto (copia en escritura):
+        solo se crean individuos cuyo genoma cambia.
+        """
+        rng = resolve_rng(rng)
+        num_bits = parent1.num_bits
+        if rng.random() >= probability or num_bits < 3:
+            return parent1, parent2
         
-        # Seleccionar dos puntos
-        point1, point2 = sorted(random.sample(range(1, len(parent1.genes)), 2))
+        # Seleccionar dos puntos distintos en 1..num_bits-1
+        point1 = int(rng.integers(1, num_bits))
+        point2 = int(rng.integers(1, num_bits - 1))
+        if point2 >= point1:
+            point2 += 1
+        point1, point2 = min(point1, point2), max(point1, point2)
+        
+        # Máscara del segmento central (genes point1..point2-1, gen 0 = bit más significativo)
+        segment_mask = ((1 << (point2 - point1)) - 1) << (num_bits - point2)
         
         # Crear descendencia
-        child1_genes = (parent1.genes[:point1] + 
-                       parent2.genes[point1:point2] + 
-                       parent1.genes[point2:])
+        child1_bits = (parent1.bits & ~segment_mask) | (parent2.bits & segment_mask)
+        child2_bits = (parent2.bits & ~segment_mask) | (parent1.bits & segment_mask)
+        
+        return parent1.with_bits(child1_bits), parent2.with_bits(child2_bits)
+    
+    def crossover_batch(self, genes: np.ndarray, pairs: np.ndarray, probability: float,
+                        rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Cruzamiento de dos puntos de todas las parejas a la vez.
+        
+        genes es la matriz de bits (individuos, num_bits) y pairs un arreglo
+        (parejas, 2) de índices de fila. Devuelve los hijos (2 * parejas,
+        num_bits), los dos de cada pareja en filas consecutivas. Decisiones y
+        puntos de corte salen de una sola llamada al generador.
+        """
+        rng = resolve_rng(rng)
+        pairs = np.asarray(pairs, dtype=np.intp)
+        num_pairs = len(pairs)
+        num_bits = genes.shape[1]
+        first = genes[pairs[:, 0]]
+        second = genes[pairs[:, 1]]
+        
+        offspring = np.empty((2 * num_pairs, num_bits), dtype=genes.dtype)
+        if num_bits < 3 or num_pairs == 0:
+            offspring[0::2] = first
+            offspring[1::2] = second
+            return offspring
         
-        child2_genes = (parent2.genes[:point1] + 
-                       parent1.genes[point1:point2] + 
-                       parent2.genes[point2:])
+        # Decisión y dos puntos distintos en 1..num_bits-1 por pareja
+        draws = rng.random((3, num_pairs))
+        do_cross = draws[0] < probability
+        point1 = 1 + (draws[1] * (num_bits - 1)).astype(np.intp)
+        point2 = 1 + (draws[2] * (num_bits - 2)).astype(np.intp)
+        point2 += point2 >= point1
+        low = np.minimum(point1, point2)[:, None]
+        high = np.maximum(point1, point2)[:, None]
         
-        return Individual(genes=child1_genes), Individual(genes=child2_genes)
+        # Máscara del segmento central de cada pareja
+        columns = np.arange(num_bits)
+        mask = (columns >= low) & (columns < high) & do_cross[:, None]
+        offspring[0::2] = np.where(mask, second, first)
+        offspring[1::2] = np.where(mask, first, second)
+        return offspring
     
     def get_name(self) -> str:
         return "Dos Puntos"
\ No newline at end of file
@@ -32,6 +32,21 @@ class JulioCesarFunction:
         except:
             return float('inf')
     
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """Evalúa función sobre un arreglo (negativo para minimizar)"""
+        return -self.evaluate_original_batch(xs)
+    
+    def evaluate_original_batch(self, xs: np.ndarray) -> np.ndarray:
+        """Evalúa función original sobre un arreglo; desbordes y NaN dan inf"""
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(over='ignore', invalid='ignore'):
+            term1 = np.log(1 + np.abs(xs ** 7))
+            term2 = np.pi * np.cos(xs)
+            term3 = np.sin(15.5 * xs)
+            values = term1 + term2 + term3
+        values[~np.isfinite(values)] = np.inf
+        return values
+    
     def get_name(self) -> str:
         return "ln(1 + |x^7|) + π cos(x) + sen(15.5x)"
     
@@ -2,12 +2,14 @@
 Estrategias específicas para el ejercicio de Julio César
 """
 
-import random
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 # IMPORTACIONES ABSOLUTAS (SIN ... ni ..)
 from domain.entities.individual import Individual
 from domain.entities.population import Population
+from domain.entities.random_streams import resolve_rng
 
 
 class ThresholdPairingSelection:
@@ -16,24 +18,37 @@ class ThresholdPairingSelection:
     def __init__(self, pc_threshold: float = 0.75):
         self.pc_threshold = pc_threshold
     
-    def select(self, population: Population, num_parents: int) -> List[Individual]:
-        """Selecciona individuos usando emparejamiento con umbral"""
-        individuals = population.individuals
-        selected = []
+    def select(self, population: Population, num_parents: int,
+               rng: Optional[np.random.Generator] = None) -> List[Individual]:
+        """
+        Selecciona individuos usando emparejamiento con umbral.
         
-        # Mantener el mejor
-        best = population.get_best_individual().copy()
-        selected.append(best)
+        Devuelve referencias a los individuos de la población (no copias):
+        el genoma de un individuo nunca se modifica en su lugar y el fitness
+        de un genoma es siempre el mismo.
+        """
+        individuals = population.individuals
+        indices = self.select_indices(
+            population.get_best_index(), len(individuals), num_parents, rng
+        )
+        return [individuals[i] for i in indices.tolist()]
+    
+    def select_indices(self, best_index: int, population_size: int, num_parents: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Índices de los padres: el mejor primero y el resto al azar (PC) o el mejor.
         
-        # Selección con umbral
-        for _ in range(num_parents - 1):
-            if random.random() <= self.pc_threshold:
-                individual = random.choice(individuals).copy()
-                selected.append(individual)
-            else:
-                selected.append(best.copy())
+        Solo necesita el índice del mejor y el tamaño de la población, así lo
+        usan tanto select() como el motor matricial.
+        """
+        rng = resolve_rng(rng)
+        if num_parents <= 1:
+            return np.full(num_parents, best_index, dtype=np.intp)
         
-        return selected
+        draws = rng.random(num_parents - 1)
+        candidates = rng.integers(0, population_size, size=num_parents - 1)
+        chosen = np.where(draws <= self.pc_threshold, candidates, best_index)
+        return np.concatenate(([best_index], chosen))
     
     def get_name(self) -> str:
         return f"Emparejamiento con Umbral (PC={self.pc_threshold})"
@@ -46,29 +61,73 @@ class ThresholdSwapMutation:
         self.pmi_threshold = pmi_threshold
         self.pmg_threshold = pmg_threshold
     
-    def mutate(self, individual: Individual, probability: float) -> Individual:
-        """Aplica mutación con umbrales"""
-        mutated_genes = individual.genes.copy()
+    def mutate(self, individual: Individual, probability: float,
+               rng: Optional[np.random.Generator] = None) -> Individual:
+        """
+        Aplica mutación con umbrales.
+        
+        Si el genoma no cambia se devuelve el mismo individuo (copia en escritura).
+        """
+        rng = resolve_rng(rng)
+        num_bits = individual.num_bits
+        mutated_bits = individual.bits
         
         # Verificar si el individuo debe mutar (PMI)
-        if random.random() > self.pmi_threshold:
-            return Individual(genes=mutated_genes)
+        if rng.random() > self.pmi_threshold:
+            return individual
         
         # Determinar qué genes van a mutar (PMG)
-        genes_to_mutate = []
-        for i in range(len(mutated_genes)):
-            if random.random() <= self.pmg_threshold:
-                genes_to_mutate.append(i)
+        genes_to_mutate = np.flatnonzero(rng.random(num_bits) <= self.pmg_threshold).tolist()
         
-        # Intercambiar genes
+        # Intercambiar genes (solo cambia el genoma si los bits difieren)
         if len(genes_to_mutate) >= 2:
             for _ in range(len(genes_to_mutate) // 2):
                 if len(genes_to_mutate) >= 2:
-                    pos1 = genes_to_mutate.pop(random.randint(0, len(genes_to_mutate) - 1))
-                    pos2 = genes_to_mutate.pop(random.randint(0, len(genes_to_mutate) - 1))
-                    mutated_genes[pos1], mutated_genes[pos2] = mutated_genes[pos2], mutated_genes[pos1]
+                    pos1 = genes_to_mutate.pop(rng.integers(len(genes_to_mutate)))
+                    pos2 = genes_to_mutate.pop(rng.integers(len(genes_to_mutate)))
+                    shift1 = num_bits - 1 - pos1
+                    shift2 = num_bits - 1 - pos2
+                    if ((mutated_bits >> shift1) ^ (mutated_bits >> shift2)) & 1:
+                        mutated_bits ^= (1 << shift1) | (1 << shift2)
         
-        return Individual(genes=mutated_genes)
+        return individual.with_bits(mutated_bits)
+    
+    def mutate_batch(self, genes: np.ndarray,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Mutación de toda la matriz de bits (individuos, num_bits) a la vez.
+        
+        Misma semántica que mutate(): PMI decide qué filas mutan, PMG qué
+        genes de cada fila se eligen, y los elegidos se intercambian por
+        parejas aleatorias (el impar sobrante queda igual). Modifica `genes`
+        en su lugar y lo devuelve.
+        """
+        rng = resolve_rng(rng)
+        rows = np.flatnonzero(rng.random(len(genes)) <= self.pmi_threshold)
+        num_bits = genes.shape[1]
+        if len(rows) == 0 or num_bits < 2:
+            return genes
+        
+        selected = rng.random((len(rows), num_bits)) <= self.pmg_threshold
+        # Orden aleatorio de los genes elegidos; los no elegidos quedan al final
+        keys = rng.random((len(rows), num_bits))
+        keys[~selected] = 2.0
+        order = np.argsort(keys, axis=1)
+        
+        # Parejas consecutivas del orden: (0, 1), (2, 3), ... hasta agotar los elegidos
+        half = num_bits // 2
+        left = order[:, 0:2 * half:2]
+        right = order[:, 1:2 * half:2]
+        num_swaps = selected.sum(axis=1) // 2
+        sub_row, slot = np.nonzero(np.arange(half) < num_swaps[:, None])
+        if len(sub_row) == 0:
+            return genes
+        
+        permutation = np.tile(np.arange(num_bits), (len(rows), 1))
+        permutation[sub_row, left[sub_row, slot]] = right[sub_row, slot]
+        permutation[sub_row, right[sub_row, slot]] = left[sub_row, slot]
+        genes[rows] = np.take_along_axis(genes[rows], permutation, axis=1)
+        return genes
     
     def get_name(self) -> str:
         return f"Mutación con Umbrales (PMI={self.pmi_threshold}, PMG={self.pmg_threshold})"
@@ -85,40 +144,37 @@ class PruneWorstSelection:
         """
         Selecciona supervivientes usando truncamiento.
         Solo elimina individuos si la población excede el tamaño objetivo.
+        
+        Devuelve referencias (no copias) a como máximo target_size individuos.
         """
-        current_size = len(population.individuals)
+        individuals = population.individuals
         
         # Si la población no excede el tamaño objetivo, mantener todos
-        if current_size <= target_size:
-            return [ind.copy() for ind in population.individuals]
-        
-        # Si excede, aplicar truncamiento (eliminar los peores)
-        # Ordenar por fitness (descendente - mejores primero)
-        sorted_individuals = sorted(
-            population.individuals,
-            key=lambda ind: ind.fitness,
-            reverse=True
-        )
+        if len(individuals) <= target_size:
+            return list(individuals)
         
-        # Calcular cuántos mantener
-        # Aplicar porcentaje de poda, pero respetar elitismo y tamaño objetivo
-        individuals_to_eliminate = int(current_size * self.prune_percentage)
-        individuals_to_keep = current_size - individuals_to_eliminate
-        
-        # Asegurar que mantenemos al menos el tamaño objetivo y el elitismo
-        individuals_to_keep = max(
-            target_size,
-            self.elitism_count,
-            individuals_to_keep
+        fitness = np.fromiter(
+            (ind.fitness for ind in individuals), dtype=float, count=len(individuals)
         )
+        return [individuals[i] for i in self.survivor_indices(fitness, target_size).tolist()]
+    
+    def survivor_indices(self, fitness: np.ndarray, target_size: int) -> np.ndarray:
+        """
+        Índices (sin orden) de los supervivientes con selección parcial en O(n).
         
-        # No podemos mantener más de los que tenemos
-        individuals_to_keep = min(individuals_to_keep, current_size)
+        Se conservan los mejores: al menos el tamaño objetivo y el elitismo
+        aunque la poda pida eliminar más, y nunca más que target_size.
+        """
+        current_size = len(fitness)
+        if current_size <= target_size:
+            return np.arange(current_size)
         
-        # Seleccionar los mejores
-        kept_individuals = sorted_individuals[:individuals_to_keep]
+        # Aplicar porcentaje de poda, pero respetar elitismo y tamaño objetivo
+        individuals_to_keep = current_size - int(current_size * self.prune_percentage)
+        individuals_to_keep = max(target_size, self.elitism_count, individuals_to_keep)
+        individuals_to_keep = min(individuals_to_keep, current_size, target_size)
         
-        return [ind.copy() for ind in kept_individuals]
+        return np.argpartition(-fitness, individuals_to_keep - 1)[:individuals_to_keep]
     
     def get_name(self) -> str:
         return f"Truncamiento ({self.prune_percentage*100:.0f}% eliminación máxima)"
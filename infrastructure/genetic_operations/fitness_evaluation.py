@@ -0,0 +1,181 @@
+"""
+Evaluación de fitness por genotipo entero con caché de memoización
+o tabla completa de fitness para espacios de búsqueda pequeños
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+# IMPORTACIÓN ABSOLUTA
+from domain.entities.ga_parameters import GAParameters
+
+
+# Límite para decodificar genotipos en enteros de 64 bits
+MAX_GENOTYPE_BITS = 62
+
+# Por debajo de este número de genotipos (2^num_bits) se evalúa todo el espacio
+DEFAULT_LOOKUP_TABLE_THRESHOLD = 4096
+
+
+class FitnessCache:
+    """Caché LRU acotada: genotipo entero -> fitness"""
+
+    def __init__(self, max_size: int = 4096):
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor que 0")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+
+    def get(self, genotype: int) -> Optional[float]:
+        """Fitness guardado o None; actualiza contadores y orden LRU"""
+        value = self._values.get(genotype)
+        if value is None:
+            self.misses += 1
+            return None
+        self._values.move_to_end(genotype)
+        self.hits += 1
+        return value
+
+    def put(self, genotype: int, fitness: float):
+        """Guarda fitness expulsando el menos usado si se excede el tamaño"""
+        self._values[genotype] = fitness
+        self._values.move_to_end(genotype)
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Genotipos y fitness guardados, del menos al más usado"""
+        count = len(self._values)
+        return (np.fromiter(self._values.keys(), dtype=np.int64, count=count),
+                np.fromiter(self._values.values(), dtype=float, count=count))
+
+    def restore(self, genotypes: np.ndarray, fitness: np.ndarray, hits: int, misses: int):
+        """Restablece el contenido (en el orden de entries()) y los contadores"""
+        self._values = OrderedDict(zip(np.asarray(genotypes).tolist(), np.asarray(fitness).tolist()))
+        self.hits = hits
+        self.misses = misses
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class FitnessLookupTable:
+    """Paisaje completo indexado por genotipo: x, fitness y valor original"""
+
+    def __init__(self, xs: np.ndarray, fitness: np.ndarray, original: np.ndarray):
+        self.xs = xs
+        self.fitness = fitness
+        self.original = original
+
+    @classmethod
+    def build(cls, objective_function, xs: np.ndarray) -> 'FitnessLookupTable':
+        """Evalúa la función sobre todos los genotipos"""
+        return cls(
+            xs=xs,
+            fitness=objective_function.evaluate_batch(xs),
+            original=objective_function.evaluate_original_batch(xs)
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
+class GenotypeEvaluator:
+    """
+    Evalúa arreglos de genotipos enteros: decodifica x y aplica la función
+    objetivo por lotes.
+
+    Si 2^num_bits no supera `lookup_table_threshold` se evalúa el espacio
+    completo al crear el evaluador (table_evaluations) y cada evaluación
+    posterior es un indexado de la tabla que cuenta como evaluación en
+    caché.
+
+    Si no, con caché, cada genotipo distinto del lote se busca una sola vez
+    y solo los ausentes se evalúan realmente.
+
+    `lookup_table` reutiliza una tabla ya construida (p. ej. por el proceso
+    principal del modelo de islas) sin volver a evaluarla ni contarla.
+    """
+
+    def __init__(self, objective_function, parameters: GAParameters,
+                 cache_size: Optional[int] = None,
+                 lookup_table_threshold: int = DEFAULT_LOOKUP_TABLE_THRESHOLD,
+                 lookup_table: Optional[FitnessLookupTable] = None):
+        num_bits = parameters.calculate_num_bits()
+        if num_bits > MAX_GENOTYPE_BITS:
+            raise ValueError(
+                f"Se admiten como máximo {MAX_GENOTYPE_BITS} bits (se requieren {num_bits})"
+            )
+
+        self.objective_function = objective_function
+        self.x_min = parameters.x_min
+        self.x_max = parameters.x_max
+        self.num_bits = num_bits
+        self.max_decimal = (1 << num_bits) - 1
+        self.cache = FitnessCache(cache_size) if cache_size else None
+
+        # real_evaluations + cached_evaluations suman las evaluaciones pedidas;
+        # la construcción de la tabla se cuenta aparte
+        self.real_evaluations = 0
+        self.cached_evaluations = 0
+        self.table_evaluations = 0
+
+        self.lookup_table = lookup_table
+        if lookup_table is None and self.max_decimal + 1 <= lookup_table_threshold:
+            all_genotypes = np.arange(self.max_decimal + 1, dtype=np.int64)
+            self.lookup_table = FitnessLookupTable.build(
+                objective_function, self.decode(all_genotypes)
+            )
+            self.table_evaluations = len(self.lookup_table)
+
+    def decode(self, genotypes: np.ndarray) -> np.ndarray:
+        """Valores x de los genotipos"""
+        if self.max_decimal == 0:
+            return np.full(len(genotypes), self.x_min, dtype=float)
+        return self.x_min + (genotypes / self.max_decimal) * (self.x_max - self.x_min)
+
+    def evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """Fitness de cada genotipo"""
+        genotypes = np.asarray(genotypes, dtype=np.int64)
+        if self.lookup_table is not None:
+            self.cached_evaluations += len(genotypes)
+            return self.lookup_table.fitness[genotypes]
+
+        if self.cache is None:
+            self.real_evaluations += len(genotypes)
+            return self.objective_function.evaluate_batch(self.decode(genotypes))
+
+        unique, inverse = np.unique(genotypes, return_inverse=True)
+        unique_fitness = np.empty(len(unique), dtype=float)
+        missing = []
+        for i, genotype in enumerate(unique.tolist()):
+            value = self.cache.get(genotype)
+            if value is None:
+                missing.append(i)
+            else:
+                unique_fitness[i] = value
+
+        if missing:
+            missing = np.array(missing)
+            computed = self.objective_function.evaluate_batch(self.decode(unique[missing]))
+            unique_fitness[missing] = computed
+            for genotype, value in zip(unique[missing].tolist(), computed.tolist()):
+                self.cache.put(genotype, value)
+
+        self.real_evaluations += len(missing)
+        self.cached_evaluations += len(genotypes) - len(missing)
+        return unique_fitness[inverse]
+
+    @property
+    def cache_hits(self) -> int:
+        """Genotipos encontrados en la caché"""
+        return self.cache.hits if self.cache else 0
+
+    @property
+    def cache_misses(self) -> int:
+        """Genotipos ausentes de la caché"""
+        return self.cache.misses if self.cache else 0
\ No newline at end of file
@@ -10,14 +10,19 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
-# Importaciones absolutas
-from presentation.controllers.exercise_controller import ExerciseController
-from presentation.views.main_window_simplified import MainWindowSimplified
-
 
 def main():
     """Función principal"""
+    # Con argumentos se usa la CLI sin interfaz gráfica (ver application.cli)
+    if len(sys.argv) > 1:
+        from application.cli import main as cli_main
+        sys.exit(cli_main())
+    
     try:
+        # La interfaz gráfica solo se importa si se va a mostrar
+        from presentation.controllers.exercise_controller import ExerciseController
+        from presentation.views.main_window_simplified import MainWindowSimplified
+        
         # Crear controlador con ejercicio de Julio César por defecto
         controller = ExerciseController(initial_exercise='julio_cesar')
         
@@ -4,25 +4,28 @@ Diálogo de progreso para la ejecución del algoritmo
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Callable, Optional
 
 
 class ProgressDialog:
     """Diálogo de progreso"""
     
-    def __init__(self, parent, max_generations: int):
+    def __init__(self, parent, max_generations: int, on_cancel: Optional[Callable] = None):
         self.parent = parent
         self.max_generations = max_generations
+        self.on_cancel = on_cancel
         self.window = None
         self.progress_bar = None
         self.progress_label = None
         self.fitness_label = None
+        self.cancel_button = None
         self.create_dialog()
     
     def create_dialog(self):
         """Crea el diálogo"""
         self.window = tk.Toplevel(self.parent)
         self.window.title("Ejecutando Algoritmo Genético")
-        self.window.geometry("450x150")
+        self.window.geometry("450x190" if self.on_cancel else "450x150")
         self.window.configure(bg='#f0f0f0')
         self.window.resizable(False, False)
         
@@ -83,7 +86,18 @@ class ProgressDialog:
             bg='#f0f0f0',
             fg='#666666'
         )
-        self.fitness_label.pack(pady=(0, 20))
+        self.fitness_label.pack(pady=(0, 10 if self.on_cancel else 20))
+        
+        # Botón de cancelación
+        if self.on_cancel:
+            self.cancel_button = tk.Button(
+                self.window,
+                text="Cancelar",
+                font=("Arial", 10),
+                command=self.cancel
+            )
+            self.cancel_button.pack(pady=(0, 10))
+            self.window.protocol("WM_DELETE_WINDOW", self.cancel)
     
     def update_progress(self, generation: int, total_generations: int, best_fitness: float):
         """Actualiza el progreso"""
@@ -91,7 +105,12 @@ class ProgressDialog:
             self.progress_bar['value'] = generation
             self.progress_label.config(text=f"Generación {generation} / {total_generations}")
             self.fitness_label.config(text=f"Mejor fitness: {best_fitness:.6f}")
-            self.window.update()
+    
+    def cancel(self):
+        """Solicita la cancelación; el diálogo se cierra al llegar el resultado"""
+        if self.cancel_button is not None:
+            self.cancel_button.config(state="disabled", text="Cancelando...")
+        self.on_cancel()
     
     def close(self):
         """Cierra el diálogo"""
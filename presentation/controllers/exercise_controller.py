@@ -2,13 +2,20 @@
 Controlador para manejar ejercicios configurables
 """
 
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from tkinter import messagebox
+import queue
+import threading
 
 # Importaciones absolutas
 from config.exercises import ExerciseManager, ExerciseConfig
-from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm, ExerciseResult
 from domain.entities.ga_parameters import GAParameters
+from application.use_cases.termination_criteria import CancellationToken
+
+if TYPE_CHECKING:
+    from application.use_cases.run_exercise_genetic_algorithm import (
+        RunExerciseGeneticAlgorithm, ExerciseResult
+    )
 
 
 class ExerciseController:
@@ -16,10 +23,20 @@ class ExerciseController:
     
     def __init__(self, initial_exercise: str = 'julio_cesar'):
         self.current_exercise_key = initial_exercise
-        self.exercise_use_case = RunExerciseGeneticAlgorithm(initial_exercise)
-        self.current_result: Optional[ExerciseResult] = None
+        self.exercise_config: ExerciseConfig = ExerciseManager.get_exercise(initial_exercise)
+        self._exercise_use_case = None
+        self.cancellation = None
+        self.current_result: Optional['ExerciseResult'] = None
         self.view = None
     
+    @property
+    def exercise_use_case(self) -> 'RunExerciseGeneticAlgorithm':
+        """Caso de uso (NumPy y el motor se importan en el primer uso)"""
+        if self._exercise_use_case is None:
+            from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+            self._exercise_use_case = RunExerciseGeneticAlgorithm(self.current_exercise_key)
+        return self._exercise_use_case
+    
     def set_view(self, view):
         """Establece referencia a la vista"""
         self.view = view
@@ -35,8 +52,10 @@ class ExerciseController:
     def change_exercise(self, exercise_key: str) -> bool:
         """Cambia a un ejercicio diferente"""
         try:
+            self.exercise_config = ExerciseManager.get_exercise(exercise_key)
             self.current_exercise_key = exercise_key
-            self.exercise_use_case.change_exercise(exercise_key)
+            if self._exercise_use_case is not None:
+                self._exercise_use_case.change_exercise(exercise_key)
             self.current_result = None
             if self.view:
                 self.view.clear_visualization()
@@ -47,7 +66,7 @@ class ExerciseController:
     
     def get_default_parameters(self) -> dict:
         """Parámetros por defecto del ejercicio"""
-        config = self.exercise_use_case.exercise_config
+        config = self.exercise_config
         return {
             'x_min': config.x_min,
             'x_max': config.x_max,
@@ -100,29 +119,51 @@ class ExerciseController:
                 'actual_precision': '...'
             }
     
-    def execute_genetic_algorithm(
-        self, 
-        params_dict: dict, 
-        progress_callback: Optional[Callable] = None
-    ) -> bool:
-        """Ejecuta el algoritmo genético"""
+    def start_genetic_algorithm(self, params_dict: dict) -> Optional[queue.Queue]:
+        """
+        Valida parámetros y ejecuta el algoritmo en un hilo trabajador.
         
+        Devuelve la cola de mensajes del hilo: ('progress', (generación, total,
+        mejor fitness, info)), y al terminar ('done', resultado) o ('error', texto).
+        El hilo no toca Tk; la vista consume la cola desde el hilo principal.
+        Una ejecución cancelada termina con ('done', resultado parcial).
+        """
         parameters = self.validate_parameters(params_dict)
         if not parameters:
-            return False
+            return None
         
-        try:
-            self.current_result = self.exercise_use_case.execute(
-                custom_parameters=parameters,
-                progress_callback=progress_callback
-            )
-            return True
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error durante la ejecución: {str(e)}")
-            return False
+        use_case = self.exercise_use_case
+        cancellation = self.cancellation = CancellationToken()
+        messages = queue.Queue()
+        
+        def progress_callback(generation, total_generations, best_fitness, info):
+            messages.put(('progress', (generation, total_generations, best_fitness, info)))
+        
+        def worker():
+            try:
+                result = use_case.execute(
+                    custom_parameters=parameters,
+                    progress_callback=progress_callback,
+                    cancellation=cancellation
+                )
+            except Exception as e:
+                messages.put(('error', str(e)))
+            else:
+                messages.put(('done', result))
+        
+        threading.Thread(target=worker, name="genetic-algorithm", daemon=True).start()
+        return messages
+    
+    def cancel_genetic_algorithm(self):
+        """Pide al hilo trabajador que se detenga tras la generación en curso"""
+        if self.cancellation is not None:
+            self.cancellation.cancel()
+    
+    def set_algorithm_result(self, result: 'ExerciseResult'):
+        """Guarda el resultado de una ejecución en segundo plano"""
+        self.current_result = result
     
-    def get_algorithm_result(self) -> Optional[ExerciseResult]:
+    def get_algorithm_result(self) -> Optional['ExerciseResult']:
         """Resultado actual"""
         return self.current_result
     
@@ -162,7 +203,7 @@ class ExerciseController:
     
     def get_strategy_summary(self) -> dict:
         """Resumen de estrategias"""
-        config = self.exercise_use_case.exercise_config
+        config = self.exercise_config
         return {
             'emparejamiento': config.pairing_strategy,
             'cruzamiento': config.crossover_strategy,
@@ -173,7 +214,7 @@ class ExerciseController:
     
     def get_function_info(self) -> dict:
         """Información de función objetivo"""
-        config = self.exercise_use_case.exercise_config
+        config = self.exercise_config
         return {
             'expression': config.function_expression,
             'description': config.function_description,
@@ -10,6 +10,7 @@ from typing import Callable, Optional
 
 # IMPORTACIÓN ABSOLUTA
 from infrastructure.genetic_operations.exercise_specific_functions import FunctionFactory
+from presentation.visualization.graph_factory import GraphFactory
 
 
 class VideoGenerator:
@@ -28,6 +29,13 @@ class VideoGenerator:
     ) -> str:
         """Crea video de la evolución del algoritmo genético"""
         
+        if not result.history.has_populations():
+            raise ValueError(
+                "No se registraron poblaciones por generación "
+                f"(nivel de registro '{result.history.level}'); "
+                "ejecute con 'every_k' o 'full' para generar el video."
+            )
+        
         try:
             if progress_callback:
                 progress_callback("Inicializando generación de video...")
@@ -41,13 +49,12 @@ class VideoGenerator:
             # Generar puntos para la función
             x_min = result.exercise_config.x_min
             x_max = result.exercise_config.x_max
-            x_vals = np.linspace(x_min, x_max, 1000)
-            y_vals = [objective_function.evaluate_original(x) for x in x_vals]
+            x_vals, y_vals = GraphFactory.get_landscape(result, objective_function)
             
             # Filtrar valores infinitos
             finite_mask = np.isfinite(y_vals)
             x_finite = x_vals[finite_mask]
-            y_finite = np.array(y_vals)[finite_mask]
+            y_finite = y_vals[finite_mask]
             
             # Configurar límites del gráfico
             self.ax.set_xlim(x_min, x_max)
@@ -56,6 +63,8 @@ class VideoGenerator:
             if progress_callback:
                 progress_callback("Preparando frames de animación...")
             
+            recorded_generations = result.history.recorded_generations()
+            
             # Crear animación
             def animate(frame):
                 self.ax.clear()
@@ -69,17 +78,11 @@ class VideoGenerator:
                     population = result.population_history[frame]
                     
                     # Calcular posiciones x y valores y
-                    population_x = []
-                    population_y = []
-                    population_fitness = []
-                    
-                    for individual in population.individuals:
-                        x_val = individual.to_decimal(x_min, x_max)
-                        y_val = objective_function.evaluate_original(x_val)
-                        
-                        population_x.append(x_val)
-                        population_y.append(y_val)
-                        population_fitness.append(individual.fitness)
+                    population_x = [ind.to_decimal(x_min, x_max) for ind in population.individuals]
+                    population_y = GraphFactory.get_original_values(
+                        result, objective_function, population, population_x
+                    )
+                    population_fitness = [ind.fitness for ind in population.individuals]
                     
                     # Plotear población
                     scatter = self.ax.scatter(population_x, population_y, 
@@ -100,7 +103,7 @@ class VideoGenerator:
                 objective_word = "Minimización" if result.is_minimization else "Maximización"
                 self.ax.set_xlabel('x', fontsize=14)
                 self.ax.set_ylabel('f(x)', fontsize=14)
-                self.ax.set_title(f'{objective_word} - Generación {frame}', 
+                self.ax.set_title(f'{objective_word} - Generación {recorded_generations[frame]}', 
                                 fontsize=16, fontweight='bold')
                 self.ax.legend()
                 self.ax.grid(True, alpha=0.3)
@@ -6,12 +6,15 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from typing import Optional
 import os
+import queue
 
 # IMPORTACIONES ABSOLUTAS
 from presentation.components.parameter_input import ParameterInputPanel
 from presentation.components.progress_dialog import ProgressDialog
-from presentation.visualization.graph_factory import GraphFactory
-from presentation.utils.video_generator import VideoGenerator
+
+
+# Intervalo de consulta de la cola de progreso del hilo trabajador (ms)
+PROGRESS_POLL_MS = 50
 
 
 class MainWindowSimplified:
@@ -24,8 +27,8 @@ class MainWindowSimplified:
         
         # Referencias
         self.parameter_panel = None
-        self.graph_factory = GraphFactory()
-        self.video_generator = VideoGenerator()
+        self._graph_factory = None
+        self._video_generator = None
         self.current_canvas = None
         self.current_figure = None
         self.graph_buttons = []
@@ -36,6 +39,22 @@ class MainWindowSimplified:
         
         self.create_interface()
     
+    @property
+    def graph_factory(self):
+        """Factory de gráficas (matplotlib se importa en la primera gráfica)"""
+        if self._graph_factory is None:
+            from presentation.visualization.graph_factory import GraphFactory
+            self._graph_factory = GraphFactory()
+        return self._graph_factory
+    
+    @property
+    def video_generator(self):
+        """Generador de video (matplotlib.animation se importa en el primer video)"""
+        if self._video_generator is None:
+            from presentation.utils.video_generator import VideoGenerator
+            self._video_generator = VideoGenerator()
+        return self._video_generator
+    
     def setup_window(self):
         """Configura ventana principal"""
         self.root.title("Algoritmo Genético - Optimización con Estrategias Específicas")
@@ -253,43 +272,58 @@ class MainWindowSimplified:
             self.parameter_panel.execute_algorithm()
     
     def on_execute_algorithm(self, params_dict: dict) -> bool:
-        """Callback para ejecutar algoritmo"""
-        progress_dialog = ProgressDialog(self.root, params_dict['num_generations'])
+        """Callback para ejecutar algoritmo (en segundo plano)"""
+        messages = self.controller.start_genetic_algorithm(params_dict)
+        if messages is None:
+            return False
+        
+        # Deshabilitar botón durante ejecución
+        self.execute_btn.config(state="disabled", text="⏳ Ejecutando...")
+        progress_dialog = ProgressDialog(
+            self.root, params_dict['num_generations'],
+            on_cancel=self.controller.cancel_genetic_algorithm
+        )
+        self.root.after(PROGRESS_POLL_MS, self.poll_execution, messages, progress_dialog)
+        return True
+    
+    def poll_execution(self, messages, progress_dialog: ProgressDialog):
+        """Consume la cola del hilo trabajador; solo se muestra el último progreso"""
+        progress = None
+        finished = None
+        while True:
+            try:
+                kind, payload = messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                progress = payload
+            else:
+                finished = (kind, payload)
         
-        def progress_callback(generation, total_generations, best_fitness, strategy_info):
+        if progress:
+            generation, total_generations, best_fitness, _ = progress
             progress_dialog.update_progress(generation, total_generations, best_fitness)
         
-        try:
-            # Deshabilitar botón durante ejecución
-            self.execute_btn.config(state="disabled", text="⏳ Ejecutando...")
-            self.root.update()
-            
-            success = self.controller.execute_genetic_algorithm(
-                params_dict, 
-                progress_callback
-            )
-            
-            progress_dialog.close()
-            
-            if success:
-                self.update_results_display()
-                self.graph_buttons_enabled(True)
-                self.report_btn.config(state="normal")
-                self.video_btn.config(state="normal")
-                
-                # Mostrar automáticamente la primera gráfica
-                self.show_graph("objective_population")
-            
-            # Rehabilitar botón
-            self.execute_btn.config(state="normal", text="🚀 EJECUTAR ALGORITMO")
-            
-            return success
-            
-        except Exception as e:
-            progress_dialog.close()
-            self.execute_btn.config(state="normal", text="🚀 EJECUTAR ALGORITMO")
-            messagebox.showerror("Error", f"Error ejecutando algoritmo: {str(e)}")
-            return False
+        if finished is None:
+            self.root.after(PROGRESS_POLL_MS, self.poll_execution, messages, progress_dialog)
+            return
+        
+        progress_dialog.close()
+        self.execute_btn.config(state="normal", text="🚀 EJECUTAR ALGORITMO")
+        
+        kind, payload = finished
+        if kind == 'error':
+            messagebox.showerror("Error", f"Error durante la ejecución: {payload}")
+            return
+        
+        self.controller.set_algorithm_result(payload)
+        self.update_results_display()
+        self.graph_buttons_enabled(True)
+        self.report_btn.config(state="normal")
+        self.video_btn.config(state="normal")
+        
+        # Mostrar automáticamente la primera gráfica
+        self.show_graph("objective_population")
     
     def update_results_display(self):
         """Actualiza resultados"""
@@ -337,7 +371,14 @@ class MainWindowSimplified:
             analysis_text += f"📈 Valor función f(x): {result.get_display_result():.8f}\n"
             analysis_text += f"🏆 Encontrado en generación: {self.find_best_generation(result)}\n"
             analysis_text += f"🔄 Total evaluaciones: {result.total_evaluations}\n"
-            analysis_text += f"📈 Mejora total: {abs(result.improvement):.8f}\n\n"
+            if result.cached_evaluations:
+                analysis_text += (f"💾 Reales / en caché: {result.real_evaluations} / "
+                                  f"{result.cached_evaluations}\n")
+            if result.table_evaluations:
+                analysis_text += f"📋 Tabla de fitness: {result.table_evaluations} evaluaciones\n"
+            analysis_text += f"📈 Mejora total: {abs(result.improvement):.8f}\n"
+            analysis_text += (f"⏹️ Parada: {result.stop_reason} "
+                              f"(generación {result.generations_run})\n\n")
             
             # Análisis de población final
             analysis_text += "👥 POBLACIÓN FINAL:\n"
@@ -414,6 +455,13 @@ class MainWindowSimplified:
             messagebox.showwarning("Advertencia", "No hay resultados para generar video.")
             return
         
+        if not self.controller.get_algorithm_result().history.has_populations():
+            messagebox.showwarning(
+                "Advertencia",
+                "La ejecución no registró poblaciones por generación; no se puede generar video."
+            )
+            return
+        
         # Seleccionar carpeta de salida
         output_dir = filedialog.askdirectory(
             title="Seleccionar carpeta para guardar el video"
@@ -523,8 +571,8 @@ class MainWindowSimplified:
             self.current_canvas = None
         
         if self.current_figure:
-            import matplotlib.pyplot as plt
-            plt.close(self.current_figure)
+            # La figura no pertenece a pyplot: basta con liberar sus ejes
+            self.current_figure.clear()
             self.current_figure = None
         
         for widget in self.graph_container.winfo_children():
@@ -573,13 +621,17 @@ class MainWindowSimplified:
         self.clear_graph_area()
         self.create_welcome_graph_message()
     
-    def find_best_generation(self, result) -> int:
-        """Encuentra generación del mejor resultado"""
+    def find_best_generation(self, result):
+        """Encuentra generación del mejor resultado ('--' si no se registró)"""
+        best_fitness_history = result.best_fitness_history
+        if not best_fitness_history:
+            return "--"
+        
         target_fitness = result.best_fitness
-        for i, fitness in enumerate(result.best_fitness_history):
+        for i, fitness in enumerate(best_fitness_history):
             if abs(fitness - target_fitness) < 1e-10:
                 return i
-        return len(result.best_fitness_history) - 1
+        return len(best_fitness_history) - 1
     
     def run(self):
         """Ejecuta la aplicación"""
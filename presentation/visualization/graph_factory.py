@@ -19,12 +19,50 @@ class GraphFactory:
         if graph_type == "objective_population":
             return self.create_objective_with_population(result)
         elif graph_type == "evolution_best":
+            if not result.history.has_best():
+                return self.create_message_figure(
+                    "No se registró la evolución del mejor individuo.\n"
+                    f"Nivel de registro usado: '{result.history.level}'."
+                )
             return self.create_evolution_best(result)
         elif graph_type == "evolution_all":
+            if not result.history.has_populations():
+                return self.create_message_figure(
+                    "No se registraron poblaciones por generación.\n"
+                    f"Nivel de registro usado: '{result.history.level}' "
+                    "(se requiere 'every_k' o 'full')."
+                )
             return self.create_evolution_all(result)
         else:
             return None
     
+    def create_message_figure(self, message: str) -> Figure:
+        """Figura con un mensaje cuando faltan datos para la gráfica"""
+        figure = Figure(figsize=(12, 8), dpi=100)
+        ax = figure.add_subplot(111)
+        ax.axis('off')
+        ax.text(0.5, 0.5, message, transform=ax.transAxes,
+               fontsize=14, ha='center', va='center', color='#666666')
+        return figure
+    
+    @staticmethod
+    def get_landscape(result, objective_function):
+        """Curva (x, f(x)); usa la tabla de fitness precalculada si existe"""
+        if result.lookup_table is not None:
+            return result.lookup_table.xs, result.lookup_table.original
+        
+        x_vals = np.linspace(result.exercise_config.x_min, result.exercise_config.x_max, 1000)
+        return x_vals, objective_function.evaluate_original_batch(x_vals)
+    
+    @staticmethod
+    def get_original_values(result, objective_function, population, population_x) -> list:
+        """Valores f(x) originales de una población"""
+        if result.lookup_table is not None:
+            genotypes = [ind.bits for ind in population.individuals]
+            return result.lookup_table.original[genotypes].tolist()
+        
+        return objective_function.evaluate_original_batch(np.array(population_x)).tolist()
+    
     def create_objective_with_population(self, result) -> Figure:
         """Gráfica de función objetivo con población completa"""
         figure = Figure(figsize=(12, 8), dpi=100)
@@ -36,15 +74,12 @@ class GraphFactory:
         # Generar puntos para la función
         x_min = result.exercise_config.x_min
         x_max = result.exercise_config.x_max
-        x_vals = np.linspace(x_min, x_max, 1000)
-        
-        # Evaluar función (valores originales)
-        y_vals = [objective_function.evaluate_original(x) for x in x_vals]
+        x_vals, y_vals = self.get_landscape(result, objective_function)
         
         # Filtrar valores infinitos
         finite_mask = np.isfinite(y_vals)
         x_finite = x_vals[finite_mask]
-        y_finite = np.array(y_vals)[finite_mask]
+        y_finite = y_vals[finite_mask]
         
         # Plotear función
         ax.plot(x_finite, y_finite, 'b-', linewidth=2, alpha=0.7,
@@ -52,17 +87,11 @@ class GraphFactory:
         
         # Población final
         final_population = result.final_population
-        population_x = []
-        population_y = []
-        population_fitness = []
-        
-        for individual in final_population.individuals:
-            x_val = individual.to_decimal(x_min, x_max)
-            y_val = objective_function.evaluate_original(x_val)
-            
-            population_x.append(x_val)
-            population_y.append(y_val)
-            population_fitness.append(individual.fitness)
+        population_x = [ind.to_decimal(x_min, x_max) for ind in final_population.individuals]
+        population_y = self.get_original_values(
+            result, objective_function, final_population, population_x
+        )
+        population_fitness = [ind.fitness for ind in final_population.individuals]
         
         # Encontrar mejor y peor según el tipo de optimización
         if result.is_minimization:
@@ -210,8 +239,10 @@ class GraphFactory:
         generation_numbers = []
         all_fitness_values = []
         
-        for gen_idx, (population, fitness_scores) in enumerate(
-            zip(result.population_history, result.fitness_history)
+        recorded_generations = result.history.recorded_generations()
+        
+        for gen_idx, population, fitness_scores in zip(
+            recorded_generations, result.population_history, result.fitness_history
         ):
             for individual, fitness in zip(population.individuals, fitness_scores):
                 x_val = individual.to_decimal(
@@ -244,11 +275,11 @@ class GraphFactory:
             )
             best_x_history.append(best_x)
         
-        ax.plot(best_x_history, range(len(best_x_history)), 
+        ax.plot(best_x_history, recorded_generations, 
                'r-', linewidth=3, alpha=0.8, label='Trayectoria del mejor')
         
         # Marcar resultado final
-        ax.scatter([result.best_x], [len(best_x_history) - 1],
+        ax.scatter([result.best_x], [recorded_generations[-1]],
                   color='red', s=150, marker='*', zorder=10,
                   label=f'Mejor final: x={result.best_x:.3f}')
         
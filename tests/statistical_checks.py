@@ -0,0 +1,12 @@
+"""
+Utilidades estadísticas compartidas por las pruebas de los operadores por lotes
+"""
+
+import numpy as np
+
+
+def chi2_homogeneity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estadístico chi² de homogeneidad de dos muestras del mismo tamaño"""
+    total = first + second
+    used = total > 0
+    return float((((first - second) ** 2)[used] / total[used]).sum())
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Pruebas de cancelación, checkpoints y reanudación bit a bit
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+from application.use_cases.termination_criteria import CancellationToken, StagnationCriterion
+
+
+@pytest.fixture
+def use_case():
+    return RunExerciseGeneticAlgorithm('julio_cesar')
+
+
+@pytest.fixture
+def parameters(use_case):
+    return replace(use_case._create_default_parameters(), num_generations=60)
+
+
+def _cancel_at(token: CancellationToken, generation: int):
+    """Callback de progreso que cancela tras `generation`"""
+    def callback(current, total, best_fitness, info):
+        if current >= generation:
+            token.cancel()
+    return callback
+
+
+def _assert_same_history(expected, actual):
+    for name, array in expected.history.to_arrays().items():
+        np.testing.assert_array_equal(array, actual.history.to_arrays()[name], err_msg=name)
+
+
+@pytest.mark.parametrize('engine', ['individual', 'matrix'])
+@pytest.mark.parametrize('recording', ['full', 'every_k'])
+def test_resume_after_cancel_matches_uninterrupted_run(use_case, parameters, tmp_path,
+                                                       engine, recording):
+    options = dict(engine=engine, recording=recording, record_every=7, seed=3,
+                   cache_size=50, lookup_table_threshold=0)
+    expected = use_case.execute(parameters, **options)
+
+    path = str(tmp_path / 'run.npz')
+    token = CancellationToken()
+    partial = use_case.execute(parameters, cancellation=token, checkpoint_path=path,
+                               progress_callback=_cancel_at(token, 23), progress_interval=0,
+                               **options)
+    assert partial.stop_reason == 'cancelled'
+
+    resumed = use_case.resume(path)
+
+    assert resumed.stop_reason == expected.stop_reason
+    assert resumed.generations_run == expected.generations_run
+    assert resumed.best_fitness == expected.best_fitness
+    assert resumed.total_evaluations == expected.total_evaluations
+    assert resumed.real_evaluations == expected.real_evaluations
+    assert resumed.cached_evaluations == expected.cached_evaluations
+    assert resumed.cache_hits == expected.cache_hits
+    assert resumed.cache_misses == expected.cache_misses
+    _assert_same_history(expected, resumed)
+
+
+def test_resume_restores_other_bit_generators(use_case, parameters, tmp_path):
+    def seed():
+        return np.random.Generator(np.random.MT19937(3))
+
+    expected = use_case.execute(parameters, seed=seed())
+
+    path = str(tmp_path / 'run.npz')
+    token = CancellationToken()
+    use_case.execute(parameters, seed=seed(), cancellation=token, checkpoint_path=path,
+                     progress_callback=_cancel_at(token, 23), progress_interval=0)
+
+    resumed = use_case.resume(path)
+
+    assert resumed.generations_run == expected.generations_run
+    assert resumed.best_fitness == expected.best_fitness
+    assert resumed.total_evaluations == expected.total_evaluations
+    _assert_same_history(expected, resumed)
+
+
+@pytest.mark.parametrize('engine', ['individual', 'matrix'])
+def test_resume_of_finished_run_returns_it_unchanged(use_case, parameters, tmp_path, engine):
+    path = str(tmp_path / 'run.npz')
+    finished = use_case.execute(parameters, engine=engine, recording='every_k', record_every=7,
+                                seed=0, termination=[StagnationCriterion(10)],
+                                checkpoint_path=path)
+    assert finished.stop_reason == 'stagnation'
+    assert finished.generations_run % 7 != 0
+
+    resumed = use_case.resume(path)
+
+    assert resumed.stop_reason == 'stagnation'
+    assert resumed.generations_run == finished.generations_run
+    assert resumed.total_evaluations == finished.total_evaluations
+    assert resumed.best_fitness == finished.best_fitness
+    assert resumed.final_population.generation == finished.generations_run
+    _assert_same_history(finished, resumed)
+
+
+def test_resume_rejects_other_strategy_params(use_case, parameters, tmp_path):
+    path = str(tmp_path / 'run.npz')
+    use_case.execute(parameters, seed=0, checkpoint_path=path)
+
+    other = RunExerciseGeneticAlgorithm('julio_cesar', strategy_params={'pc_threshold': 0.5})
+    with pytest.raises(ValueError):
+        other.resume(path)
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Pruebas del cruzamiento de dos puntos por lotes frente al escalar
+"""
+
+import numpy as np
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.individual import Individual
+from domain.entities.random_streams import create_rng
+from infrastructure.genetic_operations.crossover_strategies import TwoPointCrossover
+from tests.statistical_checks import chi2_homogeneity
+
+
+NUM_BITS = 6
+SAMPLES = 20000
+# Valor crítico de chi² con 10 grados de libertad al 0.1 %
+CHI2_CRITICAL_10 = 29.59
+
+
+def _opposite_parents(num_pairs: int, num_bits: int = NUM_BITS):
+    """Matriz con un padre de ceros y otro de unos, emparejados num_pairs veces"""
+    genes = np.array([[0] * num_bits, [1] * num_bits], dtype=np.uint8)
+    pairs = np.tile([0, 1], (num_pairs, 1))
+    return genes, pairs
+
+
+def test_batch_matches_scalar_distribution():
+    strategy = TwoPointCrossover()
+    weights = 1 << np.arange(NUM_BITS - 1, -1, -1)
+
+    genes, pairs = _opposite_parents(SAMPLES)
+    offspring = strategy.crossover_batch(genes, pairs, 0.7, create_rng(0))
+    batch_children = offspring[0::2].astype(np.int64) @ weights
+
+    rng = create_rng(1)
+    zeros, ones = Individual(0, NUM_BITS), Individual((1 << NUM_BITS) - 1, NUM_BITS)
+    scalar_children = [strategy.crossover(zeros, ones, 0.7, rng)[0].bits for _ in range(SAMPLES)]
+
+    # 10 segmentos posibles más la pareja sin cruzar
+    batch_counts = np.bincount(batch_children, minlength=1 << NUM_BITS)
+    scalar_counts = np.bincount(scalar_children, minlength=1 << NUM_BITS)
+    assert np.count_nonzero(batch_counts + scalar_counts) == 11
+    assert chi2_homogeneity(batch_counts, scalar_counts) < CHI2_CRITICAL_10
+
+
+def test_children_are_complementary_segments():
+    genes, pairs = _opposite_parents(2000)
+    offspring = TwoPointCrossover().crossover_batch(genes, pairs, 0.9, create_rng(2))
+    first, second = offspring[0::2], offspring[1::2]
+
+    # Cada gen viene de un padre y el otro hijo recibe el del otro padre
+    assert np.array_equal(first ^ second, np.ones_like(first))
+    # El gen 0 nunca se intercambia y el segmento cruzado es contiguo
+    assert not first[:, 0].any()
+    assert (np.abs(np.diff(first.astype(np.int8), axis=1)).sum(axis=1) <= 2).all()
+
+
+@pytest.mark.parametrize('probability, num_bits', [(0.0, NUM_BITS), (1.0, 2)])
+def test_without_crossover_children_copy_parents(probability, num_bits):
+    genes, pairs = _opposite_parents(100, num_bits)
+    offspring = TwoPointCrossover().crossover_batch(genes, pairs, probability, create_rng(3))
+
+    assert not offspring[0::2].any()
+    assert offspring[1::2].all()
\ No newline at end of file
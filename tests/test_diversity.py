@@ -0,0 +1,35 @@
+"""
+Pruebas de la diversidad de Hamming por conteos de bits
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.population import Population, hamming_diversity
+from domain.entities.random_streams import create_rng
+
+
+def _brute_force(genotypes) -> float:
+    """Media de la distancia de Hamming sobre todos los pares"""
+    distances = [bin(a ^ b).count('1') for a, b in combinations(genotypes, 2)]
+    return float(np.mean(distances))
+
+
+@pytest.mark.parametrize('num_bits', [1, 5, 8, 9, 20, 62])
+def test_matches_brute_force(num_bits):
+    population = Population.create_random(40, num_bits, rng=create_rng(num_bits))
+    genotypes = [individual.bits for individual in population]
+
+    expected = _brute_force(genotypes)
+
+    assert hamming_diversity(np.array(genotypes, dtype=np.int64), num_bits) == pytest.approx(expected)
+    assert population.get_hamming_diversity() == pytest.approx(expected)
+
+
+def test_degenerate_populations():
+    assert hamming_diversity(np.array([5]), 3) == 0.0
+    assert hamming_diversity(np.array([5, 5, 5]), 3) == 0.0
+    assert hamming_diversity(np.array([0, 7]), 3) == 3.0
\ No newline at end of file
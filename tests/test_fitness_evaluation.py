@@ -0,0 +1,27 @@
+"""
+Pruebas del reparto de evaluaciones entre reales, en caché y tabla
+"""
+
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'lookup_table_threshold': 0},
+    {'lookup_table_threshold': 0, 'cache_size': 50},
+])
+def test_real_and_cached_evaluations_sum_to_total(options):
+    result = RunExerciseGeneticAlgorithm('julio_cesar').execute(seed=0, **options)
+
+    assert result.real_evaluations + result.cached_evaluations == result.total_evaluations
+
+
+def test_lookup_table_build_is_reported_separately():
+    result = RunExerciseGeneticAlgorithm('julio_cesar').execute(seed=0)
+
+    assert result.lookup_table is not None
+    assert result.table_evaluations == len(result.lookup_table)
+    assert result.real_evaluations == 0
\ No newline at end of file
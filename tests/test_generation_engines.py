@@ -0,0 +1,49 @@
+"""
+Pruebas del motor matricial frente al motor clásico por individuos
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+from tests.statistical_checks import chi2_homogeneity
+
+
+RUNS = 300
+NUM_GENERATIONS = 10
+# Valor crítico de chi² con 4 grados de libertad al 0.1 %
+CHI2_CRITICAL_4 = 18.47
+
+
+def _final_statistics(engine: str, seeds: range) -> np.ndarray:
+    """Fitness medio y genotipos distintos de la última generación de cada corrida"""
+    use_case = RunExerciseGeneticAlgorithm('julio_cesar')
+    parameters = replace(use_case._create_default_parameters(), num_generations=NUM_GENERATIONS)
+
+    statistics = []
+    for seed in seeds:
+        *_, last = use_case.iterate(parameters, engine=engine, seed=seed)
+        statistics.append((last.fitness.mean(), len(np.unique(last.genotypes))))
+    return np.array(statistics)
+
+
+@pytest.fixture(scope='module')
+def statistics():
+    return (
+        _final_statistics('individual', range(RUNS)),
+        _final_statistics('matrix', range(RUNS, 2 * RUNS)),
+    )
+
+
+@pytest.mark.parametrize('column', [0, 1], ids=['mean_fitness', 'distinct_genotypes'])
+def test_engines_match_in_distribution(statistics, column):
+    individual, matrix = statistics[0][:, column], statistics[1][:, column]
+
+    # Quintiles de la muestra conjunta como clases
+    edges = np.quantile(np.concatenate((individual, matrix)), [0.2, 0.4, 0.6, 0.8])
+    individual_counts = np.bincount(np.searchsorted(edges, individual, side='right'), minlength=5)
+    matrix_counts = np.bincount(np.searchsorted(edges, matrix, side='right'), minlength=5)
+    assert chi2_homogeneity(individual_counts, matrix_counts) < CHI2_CRITICAL_4
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Pruebas de los contadores de evaluaciones del modelo de islas
+"""
+
+from dataclasses import replace
+
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+from application.use_cases.run_island_model import RunIslandModel
+
+
+@pytest.mark.parametrize('max_workers', [0, 2])
+def test_cache_persists_across_epochs(max_workers):
+    result = RunIslandModel(num_islands=3, max_workers=max_workers).execute(
+        seed=1, cache_size=50, lookup_table_threshold=0, recording='none'
+    )
+
+    assert result.real_evaluations + result.cached_evaluations == result.total_evaluations
+    assert result.cache_misses == result.real_evaluations
+    assert result.cache_hits > 0
+
+
+def test_lookup_table_is_built_once():
+    result = RunIslandModel(num_islands=4, max_workers=0).execute(seed=1, recording='none')
+
+    assert result.table_evaluations == len(result.lookup_table)
+    assert result.real_evaluations == 0
+    assert result.cached_evaluations == result.total_evaluations
+
+
+def test_zero_generations_returns_initial_populations():
+    parameters = replace(
+        RunExerciseGeneticAlgorithm()._create_default_parameters(), num_generations=0
+    )
+    result = RunIslandModel(num_islands=3, max_workers=0).execute(parameters, seed=1)
+
+    assert result.generations_run == 0
+    assert len(result.final_population) == 3 * parameters.population_size
+    assert result.total_evaluations == 3 * parameters.population_size
+    assert result.improvement == 0
+    assert result.history.num_stats == 1
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Pruebas de la mutación con umbrales por lotes frente a la escalar
+"""
+
+import numpy as np
+
+# IMPORTACIONES ABSOLUTAS
+from domain.entities.individual import Individual
+from domain.entities.random_streams import create_rng
+from infrastructure.genetic_operations.exercise_specific_strategies import ThresholdSwapMutation
+from tests.statistical_checks import chi2_homogeneity
+
+
+NUM_BITS = 12
+SAMPLES = 20000
+GENOME = 0b101100111000
+# Valor crítico de chi² con 3 grados de libertad al 0.1 %
+CHI2_CRITICAL_3 = 16.27
+
+
+def _genome_rows(count: int) -> np.ndarray:
+    """count filas con los bits de GENOME (gen 0 = bit más significativo)"""
+    row = [(GENOME >> (NUM_BITS - 1 - position)) & 1 for position in range(NUM_BITS)]
+    return np.tile(np.array(row, dtype=np.uint8), (count, 1))
+
+
+def test_batch_matches_scalar_distribution():
+    strategy = ThresholdSwapMutation(pmi_threshold=0.5, pmg_threshold=0.3)
+
+    original = _genome_rows(SAMPLES)
+    mutated = strategy.mutate_batch(original.copy(), create_rng(0))
+    batch_changed = (mutated != original).sum(axis=1)
+
+    rng = create_rng(1)
+    individual = Individual(GENOME, NUM_BITS)
+    scalar_changed = [
+        bin(strategy.mutate(individual, 0.0, rng).bits ^ GENOME).count('1')
+        for _ in range(SAMPLES)
+    ]
+
+    # Bits cambiados (siempre pares): 0, 2, 4 y 6 o más
+    bins = [0, 1, 3, 5, NUM_BITS + 1]
+    batch_counts = np.histogram(batch_changed, bins=bins)[0]
+    scalar_counts = np.histogram(scalar_changed, bins=bins)[0]
+    assert chi2_homogeneity(batch_counts, scalar_counts) < CHI2_CRITICAL_3
+
+
+def test_swaps_preserve_number_of_ones():
+    original = _genome_rows(500)
+    mutated = ThresholdSwapMutation(1.0, 0.5).mutate_batch(original.copy(), create_rng(2))
+
+    assert (mutated != original).any()
+    assert np.array_equal(mutated.sum(axis=1), original.sum(axis=1))
+
+
+def test_zero_pmi_leaves_genes_unchanged():
+    original = _genome_rows(500)
+    mutated = ThresholdSwapMutation(0.0, 0.5).mutate_batch(original.copy(), create_rng(3))
+
+    assert np.array_equal(mutated, original)
\ No newline at end of file
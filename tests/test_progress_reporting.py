@@ -0,0 +1,68 @@
+"""
+Pruebas del reporte de progreso limitado por frecuencia con un reloj simulado
+"""
+
+from dataclasses import replace
+
+import pytest
+
+# IMPORTACIONES ABSOLUTAS
+from application.use_cases.progress_reporting import ProgressReporter
+from application.use_cases.run_exercise_genetic_algorithm import RunExerciseGeneticAlgorithm
+
+
+NUM_GENERATIONS = 20
+
+
+class FakeClock:
+    """Reloj que solo avanza cuando la prueba lo indica"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def snapshots():
+    use_case = RunExerciseGeneticAlgorithm('julio_cesar')
+    parameters = replace(use_case._create_default_parameters(), num_generations=NUM_GENERATIONS)
+    return list(use_case.iterate(parameters, seed=0))
+
+
+def _delivered_generations(snapshots, interval: float, seconds_per_generation: float = 1.0) -> list:
+    """(generación, info) de cada entrega si cada generación tarda lo indicado"""
+    delivered = []
+    clock = FakeClock()
+    reporter = ProgressReporter(
+        lambda generation, total, best_fitness, info: delivered.append((generation, info)),
+        interval, clock=clock
+    )
+    for snapshot in snapshots:
+        clock.now = snapshot.generation * seconds_per_generation
+        reporter.report(snapshot)
+    assert reporter.delivered == len(delivered)
+    return delivered
+
+
+def test_updates_are_coalesced(snapshots):
+    delivered = _delivered_generations(snapshots, interval=2.5)
+
+    assert [generation for generation, _ in delivered] == [0, 3, 6, 9, 12, 15, 18, 20]
+
+
+def test_first_and_final_updates_are_always_delivered(snapshots):
+    delivered = _delivered_generations(snapshots, interval=1000.0)
+
+    assert [generation for generation, _ in delivered] == [0, NUM_GENERATIONS]
+    assert not delivered[0][1]['final']
+    assert delivered[-1][1]['final']
+    assert delivered[-1][1]['stop_reason'] == 'max_generations'
+
+
+def test_zero_interval_reports_every_generation(snapshots):
+    # Sin intervalo se entrega todo aunque el reloj no avance
+    delivered = _delivered_generations(snapshots, interval=0, seconds_per_generation=0.0)
+
+    assert [generation for generation, _ in delivered] == list(range(NUM_GENERATIONS + 1))
\ No newline at end of file